@@ -501,8 +501,18 @@ def compare_coe_files(template_path: Path, generated_path: Path):
     return 0
 
 
-def main():
-    """Main entry point with argparse CLI."""
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Main entry point with argparse CLI.
+
+    Args:
+        argv: Argument list to parse instead of ``sys.argv[1:]``. Lets callers
+            run the visualizer in-process rather than spawning a new
+            interpreter per file.
+
+    Returns:
+        Process exit code (0 on success, 1 on error)
+    """
     parser = argparse.ArgumentParser(
         description="Visualize PCIe configuration space from .coe files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -527,7 +537,7 @@ Examples:
         help='Skip endianness validation warnings'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if len(args.files) == 1:
         # Single file visualization
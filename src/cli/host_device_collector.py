@@ -9,7 +9,6 @@ for VFIO operations inside the container.
 import json
 import logging
 import time
-from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -17,7 +16,9 @@ from pcileechfwgenerator.cli.vfio_handler import VFIOBinder
 from pcileechfwgenerator.device_clone.config_space_manager import ConfigSpaceManager
 from pcileechfwgenerator.device_clone.device_info_lookup import DeviceInfoLookup
 from pcileechfwgenerator.device_clone.msix import MSIXData, MSIXManager
-from pcileechfwgenerator.device_clone.msix_capability import parse_msix_capability
+from pcileechfwgenerator.device_clone.msix_capability import (
+    parse_msix_capability_bytes,
+)
 from pcileechfwgenerator.exceptions import BuildError
 from pcileechfwgenerator.string_utils import (
     log_error_safe,
@@ -31,9 +32,17 @@ class HostDeviceCollector:
     """Collects all device information on the host before container launch."""
 
     def _serialize_msix_data(self, msix_data: MSIXData) -> Optional[Dict[str, Any]]:
-        """Serialize msix_data if preloaded, else return None."""
+        """Serialize msix_data if preloaded, else return None.
+
+        The raw config space bytes are left out: they are not JSON-serializable
+        and the same data is already carried as config_space_hex.
+        """
         if msix_data.preloaded:
-            return asdict(msix_data)
+            return {
+                "preloaded": msix_data.preloaded,
+                "msix_info": msix_data.msix_info,
+                "config_space_hex": msix_data.config_space_hex,
+            }
         return None
 
     def __init__(
@@ -110,10 +119,13 @@ class HostDeviceCollector:
                     extracted_info, from_config_manager=True
                 )
 
+                # Hex-encode once; reused by MSI-X parsing and the saved payload
+                config_space_hex = config_space_bytes.hex()
+
                 # 3. Use existing MSIXManager for MSI-X data collection
                 msix_manager = MSIXManager(self.bdf, self.logger)
                 msix_data = self._collect_msix_data_vfio(
-                    msix_manager, config_space_bytes
+                    msix_manager, config_space_bytes, config_space_hex
                 )
 
                 # 4. Collect BAR models via MMIO learning (optional)
@@ -124,7 +136,6 @@ class HostDeviceCollector:
                 # 5. Save collected data for container consumption
                 # Note: Template context building is deferred to the container
                 # to avoid duplicating PCILeechContextBuilder instantiation
-                config_space_hex = config_space_bytes.hex()
 
                 # Validate that we have the full config space
                 if len(config_space_hex) != len(config_space_bytes) * 2:
@@ -179,22 +190,25 @@ class HostDeviceCollector:
                 raise BuildError(f"Host device collection failed: {e}") from e
 
     def _collect_msix_data_vfio(
-        self, msix_manager: MSIXManager, config_space_bytes: bytes
+        self,
+        msix_manager: MSIXManager,
+        config_space_bytes: bytes,
+        config_space_hex: Optional[str] = None,
     ) -> MSIXData:
         """Collect MSI-X data using VFIO access.
 
         Args:
             msix_manager: MSIXManager instance
             config_space_bytes: Raw config space data
+            config_space_hex: Hex form of config_space_bytes, if the caller
+                already computed it
 
         Returns:
             MSIXData object with collected information
         """
         try:
-            # Parse MSI-X capability from config space
-
-            config_space_hex = config_space_bytes.hex()
-            msix_info = parse_msix_capability(config_space_hex)
+            # Parse MSI-X capability directly from the raw config space bytes
+            msix_info = parse_msix_capability_bytes(config_space_bytes)
 
             if msix_info and msix_info.get("table_size", 0) > 0:
                 log_info_safe(
@@ -212,6 +226,8 @@ class HostDeviceCollector:
                     prefix="MSIX",
                 )
 
+                if config_space_hex is None:
+                    config_space_hex = config_space_bytes.hex()
                 return MSIXData(
                     preloaded=True,
                     msix_info=msix_info,
@@ -335,10 +351,14 @@ class HostDeviceCollector:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save complete device context
+        # Save complete device context. The file is machine-consumed by the
+        # container, so encode it compactly in one shot: json.dumps without
+        # indent uses the C encoder, whereas json.dump(..., indent=2) walks
+        # the whole context in the pure-Python encoder.
         context_file = output_dir / "device_context.json"
-        with open(context_file, "w") as f:
-            json.dump(data, f, indent=2)
+        context_file.write_text(
+            json.dumps(data, separators=(",", ":")), encoding="utf-8"
+        )
 
         # Validate that the file was written correctly
         try:
@@ -370,8 +390,8 @@ class HostDeviceCollector:
                 "msix_info": data["msix_data"]["msix_info"],
                 "config_space_hex": data["config_space_hex"],
             }
-            with open(msix_file, "w") as f:
-                json.dump(msix_payload, f, indent=2)
+            # Serialize first so the file is written with a single write call
+            msix_file.write_text(json.dumps(msix_payload, indent=2), encoding="utf-8")
 
             # Validate MSIX file as well
             try:
@@ -67,6 +67,7 @@ from pcileechfwgenerator.device_clone.msix_capability import (
     is_valid_offset,
     msix_size,
     parse_msix_capability,
+    parse_msix_capability_bytes,
     read_u16_le,
     read_u32_le,
     validate_msix_configuration,
@@ -111,6 +112,7 @@ __all__ = [
     "find_cap",
     "msix_size",
     "parse_msix_capability",
+    "parse_msix_capability_bytes",
     "generate_msix_table_sv",
     "validate_msix_configuration",
     "generate_msix_capability_registers",
@@ -5,7 +5,8 @@ import secrets
 import struct
 from collections import Counter
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from pcileechfwgenerator.exceptions import ConfigSpaceError
 from pcileechfwgenerator.log_config import get_logger
@@ -16,15 +17,99 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-# Optional Rich support for visualization
-_HAVE_RICH = True
-try:
-    from rich.console import Console
-    from rich.text import Text
-except ImportError:
-    _HAVE_RICH = False
-    Console = None
-    Text = None
+
+# Optional dependencies are imported on first use so that importing this
+# module stays cheap for code paths that never visualize or compute stats.
+@lru_cache(maxsize=None)
+def _rich_available() -> bool:
+    """Return True if Rich can be imported for entropy visualization."""
+    try:
+        import rich.console  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _numpy_module():
+    """Return the NumPy module for byte histograms, or None if unavailable."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# Register overlay for one 64-byte block: (offset, keep-mask, set-bits).
+# Offsets not listed are data/general purpose registers and keep their value.
+_REG_BLOCK_SIZE = 64
+_REG_OVERLAY = (
+    (0, 0xFFFFFFF8, 0x1),  # Control register, enable bit set
+    (4, 0xFFFFFF00, 0x80),  # Status register, ready bit
+    (8, 0xFFFF0000, 0x1234),  # ID/Version register, fixed ID portion
+    (12, 0xFFFFF000, 0x0A0),  # Capabilities register, common cap bits
+    (16, 0xFFFFFF00, 0x0),  # Interrupt register, usually mostly zero
+    (20, 0xFFFFFFFE, 0x0),  # Error register, LSB usually 0
+)
+
+
+def _build_register_blocks() -> Tuple[bytes, bytes]:
+    and_block = bytearray(b"\xff" * _REG_BLOCK_SIZE)
+    or_block = bytearray(_REG_BLOCK_SIZE)
+    for offset, keep, bits in _REG_OVERLAY:
+        struct.pack_into("<I", and_block, offset, keep)
+        struct.pack_into("<I", or_block, offset, bits)
+    return bytes(and_block), bytes(or_block)
+
+
+_REG_AND_BLOCK, _REG_OR_BLOCK = _build_register_blocks()
+
+
+@lru_cache(maxsize=8)
+def _register_masks(size: int) -> Tuple[int, int]:
+    """Return (AND, OR) integer masks applying the register overlay to size bytes.
+
+    BAR sizes repeat across calls (MIXED BARs always use a 4 KiB register
+    region), so the expanded masks are cached per size. Trailing bytes that
+    do not form a full dword are left untouched.
+    """
+    body = size - (size % 4)
+    reps, rem = divmod(body, _REG_BLOCK_SIZE)
+    tail = size - body
+    and_mask = _REG_AND_BLOCK * reps + _REG_AND_BLOCK[:rem] + b"\xff" * tail
+    or_mask = _REG_OR_BLOCK * reps + _REG_OR_BLOCK[:rem] + bytes(tail)
+    return int.from_bytes(and_mask, "little"), int.from_bytes(or_mask, "little")
+
+
+def _byte_entropy(data: bytes) -> Tuple[float, int]:
+    """Return (Shannon entropy in bits/byte, distinct byte values) for data."""
+    total = len(data)
+    np = _numpy_module()
+    if np is not None:
+        counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        probs = counts[counts > 0] / total
+        return float(np.dot(probs, np.log2(1.0 / probs))), int(probs.size)
+
+    # collections.Counter executes the counting loop in C, faster than Python
+    # loops. Avoid building a separate set by deriving unique count from keys.
+    counts = Counter(data)
+    entropy = 0.0
+    for count in counts.values():
+        prob = count / total
+        entropy -= prob * math.log2(prob)
+    return entropy, len(counts)
+
+
+# Firmware image header: magic, version, image size, checksum, entry point,
+# build tag. Only size and checksum vary per BAR.
+_FW_HEADER = struct.Struct("<4sIIIII")
+_FW_MAGIC = b"FWIM"
+_FW_VERSION = 0x00010203
+_FW_ENTRY_POINT = 0x100
+_FW_BUILD_TAG = 0x60A12B34
+# Section header: magic, section offset, section length
+_FW_SECTION = struct.Struct("<4sII")
+_FW_SECTION_MAGIC = b"SECT"
 
 
 class BarContentType(Enum):
@@ -49,6 +134,7 @@ class BarContentGenerator:
         """
         self.device_signature = device_signature or secrets.token_hex(16)
         self.device_seed = self._generate_device_seed()
+        self._console = None  # Rich console, created on first visualization
 
     def _generate_device_seed(self) -> bytes:
         """Generate deterministic seed unique to this device.
@@ -94,42 +180,18 @@ class BarContentGenerator:
         return out
 
     def _generate_register_content(self, size: int, bar_index: int) -> bytes:
-        """Generate realistic register space content"""
+        """Generate realistic register space content.
+
+        Every 64-byte block gets the same control/status/ID/capability/
+        interrupt/error overlay. The overlay is applied to the whole BAR at
+        once by treating it as one little-endian integer and combining it with
+        repeated AND/OR masks, which keeps the work in C instead of unpacking
+        each dword in Python.
+        """
         base_data = self._get_seeded_bytes(size, f"reg_bar{bar_index}")
-        content = bytearray(base_data)
-        # Overlay realistic register patterns
-        for offset in range(0, size, 4):
-            if offset + 4 <= size:
-                raw_val = struct.unpack("<I", base_data[offset : offset + 4])[0]
-                reg_offset = offset % 64
-                if reg_offset == 0:  # Control register
-                    val = (raw_val & 0xFFFFFFF8) | 0x1  # Enable bit set
-                elif reg_offset == 4:  # Status register
-                    val = (raw_val & 0xFFFFFF00) | 0x80  # Ready bit
-                elif reg_offset == 8:  # ID/Version register
-                    val = (raw_val & 0xFFFF0000) | 0x1234  # Fixed ID portion
-                elif reg_offset == 12:  # Capabilities register
-                    val = (raw_val & 0xFFFFF000) | 0x0A0  # Common cap bits
-                elif reg_offset == 16:  # Interrupt register
-                    val = raw_val & 0xFFFFFF00  # Usually mostly zero
-                elif reg_offset == 20:  # Error register
-                    val = raw_val & 0xFFFFFFFE  # Error bits, LSB usually 0
-                else:  # Data/general purpose registers
-                    val = raw_val
-                struct.pack_into("<I", content, offset, val)
-                if logger.isEnabledFor(logging.DEBUG):
-                    log_info_safe(
-                        logger,
-                        safe_format(
-                            "Reg BAR{bar} 0x{off:04X}: R=0x{raw:08X} V=0x{val:08X}",
-                            bar=bar_index,
-                            off=offset,
-                            raw=raw_val,
-                            val=val,
-                        ),
-                        prefix="BARS",
-                    )
-        return bytes(content)
+        and_mask, or_mask = _register_masks(size)
+        value = (int.from_bytes(base_data, "little") & and_mask) | or_mask
+        return value.to_bytes(size, "little")
 
     def _generate_buffer_content(self, size: int, bar_index: int) -> bytes:
         """Generate high-entropy buffer content (DMA buffers, etc.)"""
@@ -141,21 +203,27 @@ class BarContentGenerator:
         content = bytearray(base_data)
         # Add firmware header if space allows
         if size >= 32:
-            content[0:4] = b"FWIM"
-            content[4:8] = struct.pack("<I", 0x00010203)
-            content[8:12] = struct.pack("<I", size)
             checksum = sum(base_data[16 : min(1024, size)]) & 0xFFFFFFFF
-            content[12:16] = struct.pack("<I", checksum)
-            content[16:20] = struct.pack("<I", 0x100)
-            content[20:24] = struct.pack("<I", 0x60A12B34)
+            _FW_HEADER.pack_into(
+                content,
+                0,
+                _FW_MAGIC,
+                _FW_VERSION,
+                size,
+                checksum,
+                _FW_ENTRY_POINT,
+                _FW_BUILD_TAG,
+            )
+        # At most ~16 sections: the interval grows with size past 8 KiB
         section_interval = max(512, size // 16)
-        for i in range(64, size, section_interval):
-            if i + 12 <= size:
-                content[i : i + 4] = b"SECT"
-                content[i + 4 : i + 8] = struct.pack("<I", i)
-                content[i + 8 : i + 12] = struct.pack(
-                    "<I", min(section_interval, size - i)
-                )
+        for i in range(64, size - _FW_SECTION.size + 1, section_interval):
+            _FW_SECTION.pack_into(
+                content,
+                i,
+                _FW_SECTION_MAGIC,
+                i,
+                min(section_interval, size - i),
+            )
         if logger.isEnabledFor(logging.DEBUG):
             log_info_safe(
                 logger,
@@ -169,23 +237,23 @@ class BarContentGenerator:
         return bytes(content)
 
     def _generate_mixed_content(self, size: int, bar_index: int) -> bytes:
-        """Generate mixed content (registers + buffers + firmware areas)"""
-        content = bytearray(size)
+        """Generate mixed content (registers + buffers + firmware areas)
+
+        Regions are concatenated with a single bytes.join rather than staged
+        in a zero-filled bytearray and copied out again, which keeps peak
+        memory at roughly twice the BAR size for large MIXED BARs.
+        """
         reg_size = min(4096, size // 4)
         fw_size = min(8192, size // 3)
         buf_size = size - reg_size - fw_size
-        offset = 0
+        regions = []
         if reg_size > 0:
-            reg_content = self._generate_register_content(reg_size, bar_index)
-            content[offset : offset + reg_size] = reg_content
-            offset += reg_size
+            regions.append(self._generate_register_content(reg_size, bar_index))
         if fw_size > 0:
-            fw_content = self._generate_firmware_content(fw_size, bar_index)
-            content[offset : offset + fw_size] = fw_content
-            offset += fw_size
+            regions.append(self._generate_firmware_content(fw_size, bar_index))
         if buf_size > 0:
-            buf_content = self._generate_buffer_content(buf_size, bar_index)
-            content[offset : offset + buf_size] = buf_content
+            regions.append(self._generate_buffer_content(buf_size, bar_index))
+        content = b"".join(regions)
         if logger.isEnabledFor(logging.DEBUG):
             log_info_safe(
                 logger,
@@ -196,7 +264,7 @@ class BarContentGenerator:
                 ),
                 prefix="BARS",
             )
-        return bytes(content)
+        return content
 
     def _generate_from_learned_model(
         self, size: int, bar_index: int, model: "BarModel"
@@ -244,11 +312,9 @@ class BarContentGenerator:
             if offset + reg.width > size:
                 log_info_safe(
                     logger,
-                    safe_format(
-                        "Skipping register at 0x{off:X} (exceeds BAR size)",
-                        off=offset,
-                    ),
+                    "Skipping register at 0x{off:X} (exceeds BAR size)",
                     prefix="BARS",
+                    off=offset,
                 )
                 continue
 
@@ -262,12 +328,10 @@ class BarContentGenerator:
             else:
                 log_info_safe(
                     logger,
-                    safe_format(
-                        "Unsupported register width {width} at 0x{off:X}",
-                        width=reg.width,
-                        off=offset,
-                    ),
+                    "Unsupported register width {width} at 0x{off:X}",
                     prefix="BARS",
+                    width=reg.width,
+                    off=offset,
                 )
 
         log_info_safe(
@@ -328,13 +392,13 @@ class BarContentGenerator:
             )
 
     def generate_all_bars(
-        self, bar_sizes: Dict[int, int], visualize: bool = True
+        self, bar_sizes: Dict[int, int], visualize: bool = False
     ) -> Dict[int, bytes]:
         """
         Generate content for multiple BARs
         Args:
             bar_sizes: Dict mapping BAR index to size in bytes
-            visualize: If True, log entropy visualizations (default: True)
+            visualize: If True, log entropy visualizations (default: False)
         Returns:
             Dict mapping BAR index to content bytes
         """
@@ -366,6 +430,10 @@ class BarContentGenerator:
         
         result = {}
         total_generated = 0
+        # Resolve the log level once rather than per BAR. The per-BAR stats
+        # line needs a full entropy pass, so skip it when INFO is disabled.
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        visualize = visualize and info_enabled
         
         for bar_index, size in bar_sizes.items():
             if size <= 4096:
@@ -381,7 +449,10 @@ class BarContentGenerator:
             content = self.generate_bar_content(size, bar_index, content_type)
             result[bar_index] = content
             total_generated += size
-            
+
+            if not info_enabled:
+                continue
+
             # Calculate entropy for display
             stats = self.get_entropy_stats(content)
             entropy_pct = (stats["entropy"] / 8.0) * 100
@@ -408,7 +479,7 @@ class BarContentGenerator:
             log_info_safe(logger, bar_gen_line, prefix="BARS")
             
             # Visualize if requested
-            if visualize and logger.isEnabledFor(logging.INFO):
+            if visualize:
                 self._visualize_bar_content(content, bar_index)
         
         # Summary footer
@@ -437,16 +508,8 @@ class BarContentGenerator:
         if not data:
             return {"entropy": 0.0, "uniqueness": 0.0}
 
-        # collections.Counter executes the counting loop in C, faster than Python
-        # loops. Avoid building a separate set by deriving unique count from keys.
-        counts = Counter(data)
         total = len(data)
-        entropy = 0.0
-        for count in counts.values():
-            prob = count / total
-            entropy -= prob * math.log2(prob)
-
-        unique_bytes = len(counts)
+        entropy, unique_bytes = _byte_entropy(data)
         uniqueness = unique_bytes / 256.0
         return {
             "entropy": entropy,
@@ -465,7 +528,8 @@ class BarContentGenerator:
             bar_index: BAR index for labeling
             max_samples: Maximum number of entropy samples to show
         """
-        if not data:
+        # Entropy sampling is only needed for output that will be logged
+        if not data or not logger.isEnabledFor(logging.INFO):
             return
 
         # Calculate overall stats
@@ -506,7 +570,7 @@ class BarContentGenerator:
             offset += step
 
         # Render entropy bars
-        if _HAVE_RICH:
+        if _rich_available():
             self._render_rich_entropy(samples, bar_index)
         else:
             self._render_ascii_entropy(samples, bar_index)
@@ -515,20 +579,22 @@ class BarContentGenerator:
         """Calculate Shannon entropy for a byte sequence."""
         if not data:
             return 0.0
-        counts = Counter(data)
-        total = len(data)
-        entropy = 0.0
-        for count in counts.values():
-            prob = count / total
-            entropy -= prob * math.log2(prob)
-        return entropy
+        return _byte_entropy(data)[0]
 
     def _render_rich_entropy(
         self, samples: list, bar_index: int, width: int = 40
     ) -> None:
         """Render entropy visualization using Rich."""
-        console = Console()
-        for offset, entropy in samples:
+        from rich.text import Text
+
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+
+        # Build every sample into one Text so Rich renders it in a single pass
+        text = Text()
+        for i, (offset, entropy) in enumerate(samples):
             # Color by entropy level
             if entropy >= 7.5:
                 style = "bold green"
@@ -550,19 +616,20 @@ class BarContentGenerator:
             else:
                 bar_char = "▒" * bar_len
             
-            # Direct console output for color support
-            console.print(
-                f"  {prefix} 0x{offset:08X}: ",
-                style=style,
-                end="",
-            )
-            console.print(bar_char, style=style, end="")
-            console.print(f" {entropy:.2f}")
+            if i:
+                text.append("\n")
+            text.append(f"  {prefix} 0x{offset:08X}: ", style=style)
+            text.append(bar_char, style=style)
+            text.append(f" {entropy:.2f}")
+
+        if samples:
+            self._console.print(text)
 
     def _render_ascii_entropy(
         self, samples: list, bar_index: int, width: int = 40
     ) -> None:
         """Render entropy visualization using ASCII with intensity variation."""
+        lines = []
         for offset, entropy in samples:
             bar_len = int((entropy / 8.0) * width)
             
@@ -577,17 +644,11 @@ class BarContentGenerator:
                 bar_char = "░" * bar_len  # Light shade - low entropy
                 prefix = "!"
             
-            log_info_safe(
-                logger,
-                safe_format(
-                    "  {prefix} 0x{offset:08X}: {bar} {entropy:.2f}",
-                    prefix=prefix,
-                    offset=offset,
-                    bar=bar_char,
-                    entropy=entropy,
-                ),
-                prefix="BAR_VIZ",
-            )
+            lines.append(f"  {prefix} 0x{offset:08X}: {bar_char} {entropy:.2f}")
+
+        # One log record for the whole BAR instead of one per sample
+        if lines:
+            log_info_safe(logger, "\n".join(lines), prefix="BAR_VIZ")
 
 
 def create_BARSerator(
@@ -125,99 +125,30 @@ def is_valid_offset(data: bytearray, offset: int, size: int) -> bool:
     return offset + size <= len(data)
 
 
-def find_cap(cfg: str, cap_id: int) -> Optional[int]:
+def _empty_msix_result() -> Dict[str, Any]:
+    """Return the MSI-X capability result used when nothing could be parsed."""
+    return {
+        "table_size": 0,
+        "table_bir": 0,
+        "table_offset": 0,
+        "pba_bir": 0,
+        "pba_offset": 0,
+        "enabled": False,
+        "function_mask": False,
+    }
+
+
+def _find_std_cap_in_bytes(cfg_bytes: bytes, cap_id: int) -> Optional[int]:
     """
-    Find a capability in the PCI configuration space,
+    Walk the standard capability list of raw configuration space bytes.
 
     Args:
-        cfg: Configuration space as a hex string
+        cfg_bytes: Configuration space bytes
         cap_id: Capability ID to find (e.g., 0x11 for MSI-X)
 
     Returns:
         Offset of the capability in the configuration space, or None if not found
     """
-    log_debug_safe(
-        logger,
-        safe_format(
-            "Searching for capability ID 0x{cap_id:02x} in configuration space, Configuration space length: {length} characters",
-            cap_id=cap_id,
-            length=len(cfg),
-        ),
-        prefix="PCICAP",
-    )
-
-    # Try to use the PCI capability infrastructure first
-    try:
-        # First try standard capabilities
-        standard_offset = pci_find_cap(cfg, cap_id)
-        if standard_offset is not None:
-            log_debug_safe(
-                logger,
-                safe_format(
-                    "Found capability ID 0x{cap_id:02x} at "
-                    "standard offset 0x{offset:02x}",
-                    cap_id=cap_id,
-                    offset=standard_offset,
-                ),
-                prefix="PCICAP",
-            )
-            return standard_offset
-
-        # If not found in standard space, try extended capabilities
-        extended_offset = find_ext_cap(cfg, cap_id)
-        if extended_offset is not None:
-            log_debug_safe(
-                logger,
-                safe_format(
-                    "Found capability ID 0x{cap_id:02x} at "
-                    "extended offset 0x{offset:03x}",
-                    cap_id=cap_id,
-                    offset=extended_offset,
-                ),
-                prefix="PCICAP",
-            )
-            return extended_offset
-
-        # Not found in either space
-        log_debug_safe(
-            logger,
-            safe_format("Capability ID 0x{cap_id:02x} not found", cap_id=cap_id),
-            prefix="PCICAP",
-        )
-        return None
-
-    except Exception as e:
-        log_warning_safe(
-            logger,
-            safe_format(
-                "Error using PCI capability infrastructure: {error}, "
-                "falling back to local implementation",
-                error=e,
-            ),
-            prefix="PCICAP",
-        )
-        # Fall through to local implementation
-
-    # Fallback to local implementation for standard capabilities only
-    if not cfg or len(cfg) < 512:  # 256 bytes = 512 hex chars
-        log_warning_safe(
-            logger,
-            safe_format("Configuration space is too small (need ≥256 bytes)"),
-            prefix="PCICAP",
-        )
-        return None
-
-    try:
-        # Convert hex string to bytes for efficient processing
-        cfg_bytes = hex_to_bytes(cfg)
-    except ValueError as e:
-        log_error_safe(
-            logger,
-            safe_format("Invalid hex string in configuration space: {error}", error=e),
-            prefix="PCICAP",
-        )
-        return None
-
     # Check if capabilities are supported (Status register bit 4)
     status_offset = 0x06
     if not is_valid_offset(cfg_bytes, status_offset, 2):
@@ -309,6 +240,102 @@ def find_cap(cfg: str, cap_id: int) -> Optional[int]:
     return None
 
 
+def find_cap(cfg: str, cap_id: int) -> Optional[int]:
+    """
+    Find a capability in the PCI configuration space,
+
+    Args:
+        cfg: Configuration space as a hex string
+        cap_id: Capability ID to find (e.g., 0x11 for MSI-X)
+
+    Returns:
+        Offset of the capability in the configuration space, or None if not found
+    """
+    log_debug_safe(
+        logger,
+        safe_format(
+            "Searching for capability ID 0x{cap_id:02x} in configuration space, Configuration space length: {length} characters",
+            cap_id=cap_id,
+            length=len(cfg),
+        ),
+        prefix="PCICAP",
+    )
+
+    # Try to use the PCI capability infrastructure first
+    try:
+        # First try standard capabilities
+        standard_offset = pci_find_cap(cfg, cap_id)
+        if standard_offset is not None:
+            log_debug_safe(
+                logger,
+                safe_format(
+                    "Found capability ID 0x{cap_id:02x} at "
+                    "standard offset 0x{offset:02x}",
+                    cap_id=cap_id,
+                    offset=standard_offset,
+                ),
+                prefix="PCICAP",
+            )
+            return standard_offset
+
+        # If not found in standard space, try extended capabilities
+        extended_offset = find_ext_cap(cfg, cap_id)
+        if extended_offset is not None:
+            log_debug_safe(
+                logger,
+                safe_format(
+                    "Found capability ID 0x{cap_id:02x} at "
+                    "extended offset 0x{offset:03x}",
+                    cap_id=cap_id,
+                    offset=extended_offset,
+                ),
+                prefix="PCICAP",
+            )
+            return extended_offset
+
+        # Not found in either space
+        log_debug_safe(
+            logger,
+            safe_format("Capability ID 0x{cap_id:02x} not found", cap_id=cap_id),
+            prefix="PCICAP",
+        )
+        return None
+
+    except Exception as e:
+        log_warning_safe(
+            logger,
+            safe_format(
+                "Error using PCI capability infrastructure: {error}, "
+                "falling back to local implementation",
+                error=e,
+            ),
+            prefix="PCICAP",
+        )
+        # Fall through to local implementation
+
+    # Fallback to local implementation for standard capabilities only
+    if not cfg or len(cfg) < 512:  # 256 bytes = 512 hex chars
+        log_warning_safe(
+            logger,
+            safe_format("Configuration space is too small (need ≥256 bytes)"),
+            prefix="PCICAP",
+        )
+        return None
+
+    try:
+        # Convert hex string to bytes for efficient processing
+        cfg_bytes = hex_to_bytes(cfg)
+    except ValueError as e:
+        log_error_safe(
+            logger,
+            safe_format("Invalid hex string in configuration space: {error}", error=e),
+            prefix="PCICAP",
+        )
+        return None
+
+    return _find_std_cap_in_bytes(cfg_bytes, cap_id)
+
+
 def msix_size(cfg: str) -> int:
     """
     Determine the MSI-X table size from the configuration space.
@@ -368,56 +395,18 @@ def msix_size(cfg: str) -> int:
         return 0
 
 
-def parse_msix_capability(cfg: str) -> Dict[str, Any]:
+def _decode_msix_registers(cfg_bytes: bytes, cap: int) -> Dict[str, Any]:
     """
-    Parse the MSI-X capability structure from the configuration space.
+    Decode the MSI-X capability registers located at ``cap``.
 
     Args:
-        cfg: Configuration space as a hex string
+        cfg_bytes: Configuration space bytes
+        cap: Offset of the MSI-X capability
 
     Returns:
-        Dictionary containing MSI-X capability information:
-        - table_size: Number of MSI-X table entries
-        - table_bir: BAR indicator for the MSI-X table
-        - table_offset: Offset of the MSI-X table in the BAR
-        - pba_bir: BAR indicator for the PBA
-        - pba_offset: Offset of the PBA in the BAR
-        - enabled: Whether MSI-X is enabled
-        - function_mask: Whether the function is masked
+        Dictionary in the format returned by parse_msix_capability()
     """
-    result = {
-        "table_size": 0,
-        "table_bir": 0,
-        "table_offset": 0,
-        "pba_bir": 0,
-        "pba_offset": 0,
-        "enabled": False,
-        "function_mask": False,
-    }
-    # Find MSI-X capability (ID 0x11)
-    cap = find_cap(cfg, 0x11)
-    if cap is None:
-        log_info_safe(
-            logger,
-            "MSI-X capability not found",
-            prefix="PCICAP",
-        )
-        return result
-    log_debug_safe(
-        logger,
-        safe_format("MSI-X capability found at offset 0x{cap:02x}", cap=cap),
-        prefix="PCICAP",
-    )
-    try:
-        # Convert hex string to bytes for efficient processing
-        cfg_bytes = hex_to_bytes(cfg)
-    except ValueError as e:
-        log_error_safe(
-            logger,
-            safe_format("Invalid hex string in configuration space: {error}", error=e),
-            prefix="PCICAP",
-        )
-        return result
+    result = _empty_msix_result()
 
     # Read Message Control register (offset 2 from capability start)
     msg_ctrl_offset = cap + 2
@@ -508,6 +497,81 @@ def parse_msix_capability(cfg: str) -> Dict[str, Any]:
         return result
 
 
+def parse_msix_capability(cfg: str) -> Dict[str, Any]:
+    """
+    Parse the MSI-X capability structure from the configuration space.
+
+    Args:
+        cfg: Configuration space as a hex string
+
+    Returns:
+        Dictionary containing MSI-X capability information:
+        - table_size: Number of MSI-X table entries
+        - table_bir: BAR indicator for the MSI-X table
+        - table_offset: Offset of the MSI-X table in the BAR
+        - pba_bir: BAR indicator for the PBA
+        - pba_offset: Offset of the PBA in the BAR
+        - enabled: Whether MSI-X is enabled
+        - function_mask: Whether the function is masked
+    """
+    result = _empty_msix_result()
+    # Find MSI-X capability (ID 0x11)
+    cap = find_cap(cfg, 0x11)
+    if cap is None:
+        log_info_safe(
+            logger,
+            "MSI-X capability not found",
+            prefix="PCICAP",
+        )
+        return result
+    log_debug_safe(
+        logger,
+        safe_format("MSI-X capability found at offset 0x{cap:02x}", cap=cap),
+        prefix="PCICAP",
+    )
+    try:
+        # Convert hex string to bytes for efficient processing
+        cfg_bytes = hex_to_bytes(cfg)
+    except ValueError as e:
+        log_error_safe(
+            logger,
+            safe_format("Invalid hex string in configuration space: {error}", error=e),
+            prefix="PCICAP",
+        )
+        return result
+
+    return _decode_msix_registers(cfg_bytes, cap)
+
+
+def parse_msix_capability_bytes(cfg_bytes: bytes) -> Dict[str, Any]:
+    """
+    Parse the MSI-X capability structure from raw configuration space bytes.
+
+    MSI-X is a standard capability, so only the standard capability list is
+    walked and no hex round-trip is needed.
+
+    Args:
+        cfg_bytes: Configuration space bytes
+
+    Returns:
+        Dictionary in the format returned by parse_msix_capability()
+    """
+    cap = _find_std_cap_in_bytes(cfg_bytes, 0x11)
+    if cap is None:
+        log_info_safe(
+            logger,
+            "MSI-X capability not found",
+            prefix="PCICAP",
+        )
+        return _empty_msix_result()
+    log_debug_safe(
+        logger,
+        safe_format("MSI-X capability found at offset 0x{cap:02x}", cap=cap),
+        prefix="PCICAP",
+    )
+    return _decode_msix_registers(cfg_bytes, cap)
+
+
 def parse_bar_info_from_config_space(cfg: str) -> List[Dict[str, Any]]:
     """
     Parse BAR information from configuration space for overlap detection.
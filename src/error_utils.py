@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """Error handling utilities for exception management and user-facing messages."""
 
+import io
 import json
 import logging
 import os
 import platform
-import re
 import sys
 import traceback
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 
 class ErrorCategory(Enum):
@@ -28,176 +29,204 @@ class ErrorCategory(Enum):
     MSIX = "MSI-X Error"  # MSI-X specific parsing/validation/config issues
 
 
+# Display labels resolved once, bypassing the Enum.value descriptor per format
+_CATEGORY_LABELS: Dict[ErrorCategory, str] = {c: c.value for c in ErrorCategory}
+
+_USER_FIXABLE_CATEGORIES = frozenset(
+    {
+        ErrorCategory.USER_INPUT,
+        ErrorCategory.CONFIGURATION,
+        ErrorCategory.PERMISSION,
+        ErrorCategory.RESOURCE,
+        ErrorCategory.NETWORK,
+        ErrorCategory.MSIX,
+    }
+)
+
+
+# Fixed (category, suggestion) results shared by every categorization call
+_SUG_PERMISSION = (
+    ErrorCategory.PERMISSION,
+    "Check file permissions and ensure you have access to the required resources.",
+)
+_SUG_TEMPLATE = (
+    ErrorCategory.TEMPLATE,
+    "There's an issue with the template. Check the template syntax "
+    "and ensure all required variables are provided.",
+)
+_SUG_CONFIGURATION = (
+    ErrorCategory.CONFIGURATION,
+    "Check your configuration settings and ensure they are valid.",
+)
+_SUG_NETWORK = (
+    ErrorCategory.NETWORK,
+    "Check your network connection and ensure the target service is available.",
+)
+_SUG_RESOURCE = (
+    ErrorCategory.RESOURCE,
+    "Ensure all required resources are available and properly configured.",
+)
+_SUG_DATA = (
+    ErrorCategory.DATA,
+    "Check your data format and ensure it's valid according to the expected schema.",
+)
+_SUG_UNKNOWN = (
+    ErrorCategory.UNKNOWN,
+    "An unexpected error occurred. Check the logs for more details.",
+)
+
+
 def extract_root_cause(exception: Exception) -> str:
     """Walk the __cause__ chain to find the root exception message."""
-    root_cause = str(exception)
     current = exception
 
-    while hasattr(current, "__cause__") and current.__cause__:
+    while current.__cause__ is not None:
         current = current.__cause__
-        root_cause = str(current)
 
-    return root_cause
+    return str(current)
+
+
+def _iter_chain(exception: Optional[BaseException]) -> Iterator[str]:
+    """Yield the messages in the __cause__ chain, most specific first."""
+    while exception is not None:
+        yield str(exception)
+        exception = exception.__cause__
 
 
 def extract_exception_chain(exception: Exception) -> List[str]:
     """Return all messages in the __cause__ chain, most specific first."""
-    chain = [str(exception)]
-    current = exception
+    return list(_iter_chain(exception))
 
-    while hasattr(current, "__cause__") and current.__cause__:
-        current = current.__cause__
-        chain.append(str(current))
 
-    return chain
+def categorize_error(
+    exception: Exception, root_cause: Optional[str] = None
+) -> Tuple[ErrorCategory, str]:
+    """Return (category, suggestion); pass root_cause if already extracted."""
+    if root_cause is None:
+        root_cause = extract_root_cause(exception)
+    return _categorize_cached(type(exception), str(exception), root_cause)
 
 
-def categorize_error(exception: Exception) -> Tuple[ErrorCategory, str]:
-    error_text = str(exception)
-    root_cause = extract_root_cause(exception)
-
+@lru_cache(maxsize=512)
+def _categorize_cached(
+    exc_type: type, error_text: str, root_cause: str
+) -> Tuple[ErrorCategory, str]:
+    """Categorize by exception type and message; results are memoized."""
     lower_text = error_text.lower()
-    lower_root = root_cause.lower()
+    # The root cause only needs lowering when it differs from the message
     if (
         "msix" in lower_text
         or "msi-x" in lower_text
         or "msi x" in lower_text
-        or "msix" in lower_root
+        or (root_cause != error_text and "msix" in root_cause.lower())
     ):
         suggestion = _build_msix_suggestion(error_text)
         return (ErrorCategory.MSIX, suggestion)
 
     if (
-        isinstance(exception, (FileNotFoundError, PermissionError))
+        issubclass(exc_type, (FileNotFoundError, PermissionError))
         or "Permission denied" in root_cause
     ):
-        return (
-            ErrorCategory.PERMISSION,
-            (
-                "Check file permissions and ensure you have access to the "
-                "required resources."
-            ),
-        )
+        return _SUG_PERMISSION
 
-    if (
-        "Template" in error_text
-        or "template" in error_text.lower()
-        or "jinja" in error_text.lower()
-    ):
-        return (
-            ErrorCategory.TEMPLATE,
-            (
-                "There's an issue with the template. Check the template syntax "
-                "and ensure all required variables are provided."
-            ),
-        )
+    if "template" in lower_text or "jinja" in lower_text:
+        return _SUG_TEMPLATE
 
-    if "config" in error_text.lower() or "configuration" in error_text.lower():
-        return (
-            ErrorCategory.CONFIGURATION,
-            "Check your configuration settings and ensure they are valid.",
-        )
+    if "config" in lower_text:  # also covers "configuration"
+        return _SUG_CONFIGURATION
 
-    if (
-        "network" in error_text.lower()
-        or "connection" in error_text.lower()
-        or "timeout" in error_text.lower()
-    ):
-        return (
-            ErrorCategory.NETWORK,
-            (
-                "Check your network connection and ensure the target service "
-                "is available."
-            ),
-        )
+    if "network" in lower_text or "connection" in lower_text or "timeout" in lower_text:
+        return _SUG_NETWORK
 
-    if "resource" in error_text.lower() or "not found" in error_text.lower():
-        return (
-            ErrorCategory.RESOURCE,
-            "Ensure all required resources are available and properly configured.",
-        )
+    if "resource" in lower_text or "not found" in lower_text:
+        return _SUG_RESOURCE
 
-    if (
-        "data" in error_text.lower()
-        or "parse" in error_text.lower()
-        or "format" in error_text.lower()
-    ):
-        return (
-            ErrorCategory.DATA,
-            (
-                "Check your data format and ensure it's valid according to the "
-                "expected schema."
-            ),
-        )
-
-    return (
-        ErrorCategory.UNKNOWN,
-        "An unexpected error occurred. Check the logs for more details.",
-    )
+    if "data" in lower_text or "parse" in lower_text or "format" in lower_text:
+        return _SUG_DATA
 
+    return _SUG_UNKNOWN
 
-def _build_msix_suggestion(error_text: str) -> str:
-    text = error_text.lower()
 
-    tips: List[str] = []
+def _phrases_on_one_line(text: str, first: str, second: str) -> bool:
+    """Return True if some line of text contains first followed by second."""
+    for line in text.split("\n") if "\n" in text else (text,):
+        start = line.find(first)
+        if start != -1 and line.find(second, start + len(first)) != -1:
+            return True
+    return False
 
-    if "truncated" in text or "failed to read" in text or "parse msix" in text:
-        tips.append(
-            (
-                "Config space appears incomplete or unreadable; ensure 4KB PCIe "
-                "config space access via VFIO (device bound to vfio-pci)."
-            )
-        )
-        tips.append(
-            ("Confirm the device isn't in a low-power state " "(avoid D3cold).")
-        )
 
-    if "invalid msi-x table size" in text or re.search(r"table size .*must be", text):
-        tips.append(
-            (
-                "MSI-X table size is out of range; use the exact donor device and "
-                "capture a clean config space read."
-            )
-        )
+def _has_trigger(text: str, trigger: Union[str, Tuple[str, str]]) -> bool:
+    if isinstance(trigger, str):
+        return trigger in text
+    return _phrases_on_one_line(text, *trigger)
 
-    if "invalid msi-x table bir" in text or "invalid msi-x pba bir" in text:
-        tips.append(
-            (
-                "BIR points to an invalid BAR; verify BAR discovery under VFIO and "
-                "retry with a fresh device capture."
-            )
-        )
 
-    if "not" in text and "aligned" in text:
-        tips.append(
-            (
-                "MSI-X table/PBA offsets must be 16-byte aligned; capture a "
-                "fresh device profile after a cold boot."
-            )
-        )
+def _build_msix_suggestion(error_text: str) -> str:
+    return " ".join(f"- {t}" for t in _msix_tips(error_text))
 
-    if not tips:
-        tips.append(
-            (
-                "MSI-X capability validation failed; ensure the device supports "
-                "MSI-X and you're operating on the correct donor device."
-            )
-        )
 
-    tips.append(
+# MSI-X tips keyed by the lowercase phrases that trigger them, in display order
+# (a plain phrase, or a (first, second) pair that must appear in order on a line)
+_MSIX_RULES: Tuple[
+    Tuple[Tuple[Union[str, Tuple[str, str]], ...], Tuple[str, ...]], ...
+] = (
+    (
+        ("truncated", "failed to read", "parse msix"),
         (
-            "Re-run with --verbose to capture MSI-X offsets/values; review details "
-            "in generate.log."
-        )
-    )
-    tips.append(
+            "Config space appears incomplete or unreadable; ensure 4KB PCIe "
+            "config space access via VFIO (device bound to vfio-pci).",
+            "Confirm the device isn't in a low-power state (avoid D3cold).",
+        ),
+    ),
+    (
+        ("invalid msi-x table size", ("table size ", "must be")),
         (
-            "Use 'pcileech check --device <BDF>' to "
-            "validate VFIO setup (produces vfio_diagnostics.log)."
-        )
-    )
+            "MSI-X table size is out of range; use the exact donor device and "
+            "capture a clean config space read.",
+        ),
+    ),
+    (
+        ("invalid msi-x table bir", "invalid msi-x pba bir"),
+        (
+            "BIR points to an invalid BAR; verify BAR discovery under VFIO and "
+            "retry with a fresh device capture.",
+        ),
+    ),
+)
+_MSIX_ALIGNMENT_TIP = (
+    "MSI-X table/PBA offsets must be 16-byte aligned; capture a "
+    "fresh device profile after a cold boot."
+)
+_MSIX_FALLBACK_TIP = (
+    "MSI-X capability validation failed; ensure the device supports "
+    "MSI-X and you're operating on the correct donor device."
+)
+_MSIX_TRAILING_TIPS = (
+    "Re-run with --verbose to capture MSI-X offsets/values; review details "
+    "in generate.log.",
+    "Use 'pcileech check --device <BDF>' to "
+    "validate VFIO setup (produces vfio_diagnostics.log).",
+)
+
+
+@lru_cache(maxsize=128)
+def _msix_tips(error_text: str) -> Tuple[str, ...]:
+    """Return the MSI-X troubleshooting tips that apply to an error message."""
+    text = error_text.lower()
+
+    tips: List[str] = []
+    for triggers, rule_tips in _MSIX_RULES:
+        if any(_has_trigger(text, trigger) for trigger in triggers):
+            tips.extend(rule_tips)
+
+    if "not" in text and "aligned" in text:
+        tips.append(_MSIX_ALIGNMENT_TIP)
+
+    if not tips:
+        tips.append(_MSIX_FALLBACK_TIP)
 
-    return " ".join(f"- {t}" for t in tips)
+    return (*tips, *_MSIX_TRAILING_TIPS)
 
 
 def log_error_with_root_cause(
@@ -206,6 +235,9 @@ def log_error_with_root_cause(
     exception: Exception,
     show_full_traceback: bool = False,
 ) -> None:
+    # Nothing below can be emitted if ERROR is filtered out (DEBUG is lower)
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     root_cause = extract_root_cause(exception)
     logger.error("%s: %s", message, root_cause)
 
@@ -218,94 +250,90 @@ def format_concise_error(message: str, exception: Exception) -> str:
     return f"{message}: {root_cause}"
 
 
+def _format_suggestion_block(
+    category: ErrorCategory, suggestion: str, error_text: str
+) -> str:
+    if category == ErrorCategory.MSIX:
+        # Render the MSI-X tips as bullet lines straight from the tip list
+        return "SUGGESTIONS:" + "".join(
+            f"\n  - {tip}" for tip in _msix_tips(error_text)
+        )
+    return f"SUGGESTION: {suggestion}"
+
+
 def format_user_friendly_error(
     exception: Exception, context: Optional[str] = None
 ) -> str:
-    category, suggestion = categorize_error(exception)
     root_cause = extract_root_cause(exception)
+    category, suggestion = categorize_error(exception, root_cause=root_cause)
+    context_line = f"CONTEXT: {context}\n" if context else ""
 
-    error_parts = []
-    error_parts.append(f"ERROR TYPE: {category.value}")
-
-    if context:
-        error_parts.append(f"CONTEXT: {context}")
+    return (
+        f"ERROR TYPE: {_CATEGORY_LABELS[category]}\n"
+        f"{context_line}DETAILS: {root_cause}\n"
+        f"{_format_suggestion_block(category, suggestion, str(exception))}"
+    )
 
-    error_parts.append(f"DETAILS: {root_cause}")
 
-    if category == ErrorCategory.MSIX and suggestion:
-        error_parts.append("SUGGESTIONS:")
-        # Suggestion may contain bullet-like items joined; display as lines
-        for line in (
-            suggestion.split(" - ") if " - " in suggestion else suggestion.split("- ")
-        ):
-            line = line.strip()
-            if not line:
-                continue
-            if not line.startswith("-"):
-                line = f"- {line}"
-            error_parts.append(f"  {line}")
-    else:
-        error_parts.append(f"SUGGESTION: {suggestion}")
+def format_detailed_error(
+    exception: Exception,
+    context: Optional[str] = None,
+    include_traceback: bool = False,
+) -> str:
+    if exception.__cause__ is None and not include_traceback:
+        # Common case: a single exception and no traceback, so no stream needed
+        error_text = str(exception)
+        category, suggestion = categorize_error(exception, root_cause=error_text)
+        context_line = f"CONTEXT: {context}\n" if context else ""
+        return (
+            f"ERROR CATEGORY: {_CATEGORY_LABELS[category]}\n{context_line}"
+            f"EXCEPTION CHAIN:\n  1. {error_text}\n"
+            f"{_format_suggestion_block(category, suggestion, error_text)}"
+        )
 
-    return "\n".join(error_parts)
+    buffer = io.StringIO()
+    format_detailed_error_to(
+        buffer, exception, context=context, include_traceback=include_traceback
+    )
+    return buffer.getvalue()
 
 
-def format_detailed_error(
+def format_detailed_error_to(
+    stream: TextIO,
     exception: Exception,
     context: Optional[str] = None,
     include_traceback: bool = False,
-) -> str:
+) -> None:
+    """Write format_detailed_error() output to stream without building it first.
+
+    The traceback, which can be large for deep call stacks, is printed
+    straight to the stream rather than joined into an intermediate string.
+    """
+    error_text = str(exception)
     category, suggestion = categorize_error(exception)
-    exception_chain = extract_exception_chain(exception)
-
-    error_parts = []
-    error_parts.append(f"ERROR CATEGORY: {category.value}")
-
-    if context:
-        error_parts.append(f"CONTEXT: {context}")
-
-    error_parts.append("EXCEPTION CHAIN:")
-    for i, exc in enumerate(exception_chain):
-        error_parts.append(f"  {i+1}. {exc}")
-
-    if category == ErrorCategory.MSIX and suggestion:
-        error_parts.append("SUGGESTIONS:")
-        for line in (
-            suggestion.split(" - ") if " - " in suggestion else suggestion.split("- ")
-        ):
-            line = line.strip()
-            if not line:
-                continue
-            if not line.startswith("-"):
-                line = f"- {line}"
-            error_parts.append(f"  {line}")
-    else:
-        error_parts.append(f"SUGGESTION: {suggestion}")
+    context_line = f"CONTEXT: {context}\n" if context else ""
+    chain_lines = "".join(
+        f"\n  {i}. {msg}" for i, msg in enumerate(_iter_chain(exception), start=1)
+    )
 
-    if include_traceback:
-        tb = "".join(
-            traceback.format_exception(
-                type(exception), exception, exception.__traceback__
-            )
-        )
-        error_parts.append("TRACEBACK:")
-        error_parts.append(tb)
+    stream.write(
+        f"ERROR CATEGORY: {_CATEGORY_LABELS[category]}\n{context_line}"
+        f"EXCEPTION CHAIN:{chain_lines}\n"
+        f"{_format_suggestion_block(category, suggestion, error_text)}"
+    )
 
-    return "\n".join(error_parts)
+    if include_traceback:
+        stream.write("\nTRACEBACK:\n")
+        traceback.print_exception(exception, file=stream)
 
 
 def is_user_fixable_error(exception: Exception) -> bool:
+    # Missing files and permission problems are always user fixable; MSI-X
+    # errors, the only category checked before them, are user fixable too.
+    if isinstance(exception, (FileNotFoundError, PermissionError)):
+        return True
     category, _ = categorize_error(exception)
-    user_fixable_categories = [
-        ErrorCategory.USER_INPUT,
-        ErrorCategory.CONFIGURATION,
-        ErrorCategory.PERMISSION,
-        ErrorCategory.RESOURCE,
-        ErrorCategory.NETWORK,
-        ErrorCategory.MSIX,
-    ]
-
-    return category in user_fixable_categories
+    return category in _USER_FIXABLE_CATEGORIES
 
 
 def build_issue_report(
@@ -321,9 +349,9 @@ def build_issue_report(
     Avoids sensitive donor identifiers (serials, raw config space, BAR addrs).
     Callers must pass only safe, non-unique metadata via extra_metadata.
     """
-    category, suggestion = categorize_error(exception)
-    root_cause = extract_root_cause(exception)
     chain = extract_exception_chain(exception)
+    root_cause = chain[-1]
+    category, suggestion = categorize_error(exception, root_cause=root_cause)
 
     git_meta: Dict[str, str] = {}
     try:
@@ -357,7 +385,7 @@ def build_issue_report(
         "schema_version": 1,
         "timestamp_utc": datetime.utcnow().isoformat() + "Z",
         "error": {
-            "category": category.value,
+            "category": _CATEGORY_LABELS[category],
             "root_cause": root_cause,
             "suggestion": suggestion,
             "exception_chain": chain,
@@ -365,15 +393,11 @@ def build_issue_report(
         "environment": env_info,
         "build": {"args": build_args or []},
         "context": context or "",
-        "user_actionable": is_user_fixable_error(exception),
+        "user_actionable": category in _USER_FIXABLE_CATEGORIES,
     }
 
     if include_traceback:
-        report["error"]["traceback"] = "".join(
-            traceback.format_exception(
-                type(exception), exception, exception.__traceback__
-            )
-        )
+        report["error"]["traceback"] = "".join(traceback.format_exception(exception))
 
     if extra_metadata:
         # Only merge shallow keys; caller responsible for sanitization
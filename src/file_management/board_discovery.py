@@ -7,11 +7,17 @@ from the voltcyclone-fpga git submodule, extracting board capabilities
 and configurations dynamically.
 """
 
+import copy
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
+from ..__version__ import __version__
 from ..log_config import get_logger
 from ..string_utils import (
     log_debug_safe,
@@ -23,6 +29,79 @@ from .repo_manager import RepoManager
 
 logger = get_logger(__name__)
 
+# Persistent board discovery cache, reused across runs while the repository
+# commit and the generator version stay the same
+_BOARD_CACHE_FILE = (
+    Path(
+        os.environ.get(
+            "PCILEECH_CACHE_DIR", os.path.expanduser("~/.cache/pcileechfwgenerator")
+        )
+    )
+    / "boards.cache.json"
+)
+
+# Boards listed first in UIs (based on common usage and features)
+_RECOMMENDED_BOARDS = frozenset({"pcileech_75t484_x1", "pcileech_35t325_x4"})
+
+# Display names for boards whose generic formatting reads poorly
+_SPECIAL_DISPLAY_NAMES = {
+    "35t": "35T Legacy Board",
+    "75t": "75T Legacy Board",
+    "100t": "100T Legacy Board",
+    "pcileech_75t484_x1": "CaptainDMA 75T",
+    "pcileech_35t484_x1": "CaptainDMA 35T x1",
+    "pcileech_35t325_x4": "CaptainDMA 35T x4",
+    "pcileech_35t325_x1": "CaptainDMA 35T x1 (325)",
+    "pcileech_100t484_x1": "CaptainDMA 100T",
+    "pcileech_100t484_x4": "Artix-7 100T x4 (ZDMA-style)",
+    "pcileech_enigma_x1": "CaptainDMA Enigma x1",
+    "pcileech_squirrel": "CaptainDMA Squirrel",
+    "pcileech_pciescreamer_xc7a35": "PCIeScreamer XC7A35",
+    "pcileech_gbox": "GBOX (Thunderbolt3)",
+    "pcileech_netv2_35t": "NeTV2 35T (UDP/IP)",
+    "pcileech_netv2_100t": "NeTV2 100T (UDP/IP)",
+    "pcileech_screamer_m2": "ScreamerM2 (M.2)",
+    "pcileech_ac701": "AC701/FT601 Dev Board",
+}
+
+# Upper bound on threads used to analyze boards in parallel
+_MAX_ANALYSIS_WORKERS = 8
+
+# Board subdirectories (relative to the board root) searched for each file kind
+_SRC_DIRS = ("", "src", "rtl", "hdl")
+_IP_DIRS = ("", "ip", "ips")
+_XDC_DIRS = ("", "constraints", "xdc", "src")
+_COE_DIRS = ("", "coe", "coefficients", "src")
+_CONTENT_DIRS = ("", "src", "rtl")
+
+# Lowercase FPGA part number prefixes per device family
+_7SERIES_PART_PREFIXES = ("xc7a", "xc7k", "xc7v", "xc7z")
+_ULTRASCALE_PART_PREFIXES = ("xcku", "xcvu")
+
+# Source file name fragments that advertise each board capability
+_MSIX_PATTERNS = ("msix", "msi_x", "msi-x")
+_MSI_PATTERNS = ("msi", "interrupt")
+_DMA_PATTERNS = ("dma", "tlp", "bar_controller")
+_ROM_PATTERNS = ("option_rom", "expansion_rom", "rom_bar")
+
+# Board file name fragments identifying the PCIe IP core, in priority order
+_PCIE_IP_INDICATORS = (
+    ("pcie_axi", ("pcie_axi", "axi_pcie")),
+    ("pcie_7x", ("pcie_7x", "pcie7x")),
+    ("pcie_ultrascale", ("pcie_ultrascale", "xdma", "qdma")),
+)
+
+
+class _BoardScan(NamedTuple):
+    """Files found by a single walk of a board directory."""
+
+    src_files: List[str]
+    ip_files: List[str]
+    xdc_files: List[str]
+    coe_files: List[str]
+    sv_paths: List[Path]
+    entry_names: Set[str]
+
 
 class BoardDiscovery:
     """Discover and analyze boards from voltcyclone-fpga submodule.
@@ -131,8 +210,8 @@ class BoardDiscovery:
     }
 
     # PCIe reference clock IBUFDS_GTE2 LOC constraints for 7-series boards
-    # Maps board name to IBUFDS_GTE2 site location
-    PCIE_REFCLK_LOC_MAP = {
+    # Maps board name to IBUFDS_GTE2 site location (read-only)
+    PCIE_REFCLK_LOC_MAP = MappingProxyType({
         # Artix-7 75T boards (FGG484 package)
         "pcileech_enigma_x1": "IBUFDS_GTE2_X0Y1",
         "pcileech_75t484_x1": "IBUFDS_GTE2_X0Y1",
@@ -156,7 +235,56 @@ class BoardDiscovery:
         "pcileech_screamer_m2": "IBUFDS_GTE2_X0Y0",
         # Artix-7 200T boards (FBG676 package)
         "pcileech_ac701": "IBUFDS_GTE2_X0Y3",
-    }
+    })
+
+    # Discovery results keyed by (resolved repo root, repo root mtime_ns)
+    _discover_cache: Dict[Tuple[str, int], Dict[str, Dict]] = {}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all memoized discovery results, including the on-disk cache."""
+        cls._discover_cache.clear()
+        try:
+            _BOARD_CACHE_FILE.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _persistent_cache_key(repo_root: Path) -> Optional[List[str]]:
+        """Key for the on-disk cache, or None when the commit is unknown."""
+        head = RepoManager.head_commit(repo_root)
+        if head is None:
+            return None
+        return [str(repo_root.resolve()), head, __version__]
+
+    @staticmethod
+    def _load_persistent_cache(key: List[str]) -> Optional[Dict[str, Dict]]:
+        """Return the boards stored on disk under key, if any."""
+        try:
+            with open(_BOARD_CACHE_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        boards = data.get("boards")
+        return boards if isinstance(boards, dict) else None
+
+    @staticmethod
+    def _store_persistent_cache(key: List[str], boards: Dict[str, Dict]) -> None:
+        """Write boards to the on-disk cache; failures only cost a rescan."""
+        tmp = _BOARD_CACHE_FILE.with_suffix(_BOARD_CACHE_FILE.suffix + ".tmp")
+        try:
+            _BOARD_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "boards": boards}, f)
+            tmp.replace(_BOARD_CACHE_FILE)
+        except OSError as e:
+            log_debug_safe(
+                logger,
+                safe_format("Could not write board cache: {error}", error=e),
+                prefix="BOARDS"
+            )
 
     @classmethod
     def discover_boards(cls, repo_root: Optional[Path] = None) -> Dict[str, Dict]:
@@ -172,29 +300,80 @@ class BoardDiscovery:
         if repo_root is None:
             repo_root = RepoManager.ensure_repo()
 
+        try:
+            cache_key: Optional[Tuple[str, int]] = (
+                str(repo_root.resolve()),
+                repo_root.stat().st_mtime_ns,
+            )
+        except OSError:
+            cache_key = None
+
+        cached = cls._discover_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            log_debug_safe(
+                logger,
+                safe_format(
+                    "Using cached board discovery for {path}", path=repo_root
+                ),
+                prefix="BOARDS"
+            )
+            # Hand out a copy so callers cannot corrupt the cached configs
+            return copy.deepcopy(cached)
+
+        persistent_key = cls._persistent_cache_key(repo_root)
+        if persistent_key is not None:
+            stored = cls._load_persistent_cache(persistent_key)
+            if stored is not None:
+                log_debug_safe(
+                    logger,
+                    safe_format(
+                        "Loaded board discovery for {path} from {cache}",
+                        path=repo_root,
+                        cache=_BOARD_CACHE_FILE,
+                    ),
+                    prefix="BOARDS"
+                )
+                if cache_key:
+                    cls._discover_cache[cache_key] = copy.deepcopy(stored)
+                return stored
+
         boards = {}
+        # Subdirectory names per parent directory, so each parent shared by
+        # several boards (the repo root, CaptainDMA, ...) is listed only once
+        subdirs: Dict[Path, Set[str]] = {}
 
-        # Iterate through known board configurations
+        # Find the board directories present in this checkout
+        tasks = []
         for board_name, config in cls.BOARD_CONFIGS.items():
             board_path = repo_root / config["dir"]
-            if board_path.exists() and board_path.is_dir():
-                boards[board_name] = cls._analyze_board(
-                    board_name, board_path, config
-                )
-                log_debug_safe(
+            if cls._is_listed_dir(board_path, repo_root, subdirs):
+                tasks.append((board_name, board_path, config))
+            else:
+                log_warning_safe(
                     logger,
                     safe_format(
-                        "Discovered board: {name} at {path}",
+                        "Board '{name}' directory not found at {path}",
                         name=board_name,
                         path=board_path
                     ),
                     prefix="BOARDS"
                 )
-            else:
-                log_warning_safe(
+
+        # Board analysis is dominated by directory listings and file reads,
+        # which release the GIL, so boards are analyzed concurrently
+        if tasks:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_ANALYSIS_WORKERS, len(tasks))
+            ) as executor:
+                analyzed = list(
+                    executor.map(lambda task: cls._analyze_board(*task), tasks)
+                )
+            for (board_name, board_path, _), config in zip(tasks, analyzed):
+                boards[board_name] = config
+                log_debug_safe(
                     logger,
                     safe_format(
-                        "Board '{name}' directory not found at {path}",
+                        "Discovered board: {name} at {path}",
                         name=board_name,
                         path=board_path
                     ),
@@ -210,8 +389,44 @@ class BoardDiscovery:
             prefix="BOARDS"
         )
 
+        if cache_key:
+            cls._discover_cache[cache_key] = copy.deepcopy(boards)
+        if persistent_key is not None:
+            cls._store_persistent_cache(persistent_key, boards)
+
         return boards
 
+    @staticmethod
+    def _is_listed_dir(
+        path: Path, root: Path, subdirs: Dict[Path, Set[str]]
+    ) -> bool:
+        """
+        Check that path is a directory by listing its ancestors below root.
+
+        Args:
+            path: Directory to look for, located under root
+            root: Directory the lookup starts from
+            subdirs: Subdirectory names per already listed parent; filled in
+                as new parents are listed
+
+        Returns:
+            True if every component of path below root is a directory
+        """
+        parent = root
+        for part in path.relative_to(root).parts:
+            names = subdirs.get(parent)
+            if names is None:
+                try:
+                    with os.scandir(parent) as it:
+                        names = {entry.name for entry in it if entry.is_dir()}
+                except OSError:
+                    names = set()
+                subdirs[parent] = names
+            if part not in names:
+                return False
+            parent = parent / part
+        return True
+
     @classmethod
     def _analyze_board(
         cls, board_name: str, board_path: Path, base_config: Dict
@@ -234,17 +449,24 @@ class BoardDiscovery:
         fpga_part = config.get("fpga_part", "")
         config["fpga_family"] = cls._detect_fpga_family(fpga_part)
 
+        # Walk the board tree once; every file-based check below uses it
+        scan = cls._scan_board_tree(board_path)
+
         # Detect PCIe IP type
-        config["pcie_ip_type"] = cls._detect_pcie_ip_type(board_path, fpga_part)
+        config["pcie_ip_type"] = cls._detect_pcie_ip_type(
+            board_path, fpga_part, scan.entry_names
+        )
 
         # Scan for source files
-        config["src_files"] = cls._find_source_files(board_path)
-        config["ip_files"] = cls._find_ip_files(board_path)
-        config["xdc_files"] = cls._find_constraint_files(board_path)
-        config["coe_files"] = cls._find_coefficient_files(board_path)
+        config["src_files"] = scan.src_files
+        config["ip_files"] = scan.ip_files
+        config["xdc_files"] = scan.xdc_files
+        config["coe_files"] = scan.coe_files
 
         # Detect capabilities from source files
-        capabilities = cls._detect_capabilities(board_path, config["src_files"])
+        capabilities = cls._detect_capabilities(
+            board_path, config["src_files"], scan.sv_paths
+        )
         config.update(capabilities)
 
         # Set default values if not already present
@@ -269,17 +491,15 @@ class BoardDiscovery:
 
         return config
 
-    @classmethod
-    def _detect_fpga_family(cls, fpga_part: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _detect_fpga_family(fpga_part: str) -> str:
         """Detect FPGA family from part number."""
         fpga_part_lower = fpga_part.lower()
 
-        if any(
-            fpga_part_lower.startswith(prefix)
-            for prefix in ["xc7a", "xc7k", "xc7v", "xc7z"]
-        ):
+        if fpga_part_lower.startswith(_7SERIES_PART_PREFIXES):
             return "7series"
-        elif any(fpga_part_lower.startswith(prefix) for prefix in ["xcku", "xcvu"]):
+        elif fpga_part_lower.startswith(_ULTRASCALE_PART_PREFIXES):
             return "ultrascale"
         elif fpga_part_lower.startswith("xczu"):
             return "ultrascale_plus"
@@ -287,20 +507,29 @@ class BoardDiscovery:
             return "7series"  # Default fallback
 
     @classmethod
-    def _detect_pcie_ip_type(cls, board_path: Path, fpga_part: str) -> str:
-        """Detect PCIe IP type based on board files and FPGA part."""
-        # Check for specific IP files
-        ip_indicators = {
-            "pcie_axi": ["pcie_axi", "axi_pcie"],
-            "pcie_7x": ["pcie_7x", "pcie7x"],
-            "pcie_ultrascale": ["pcie_ultrascale", "xdma", "qdma"],
-        }
+    def _detect_pcie_ip_type(
+        cls,
+        board_path: Path,
+        fpga_part: str,
+        entry_names: Optional[Iterable[str]] = None,
+    ) -> str:
+        """Detect PCIe IP type based on board files and FPGA part.
 
-        # Scan for IP files
-        for ip_type, patterns in ip_indicators.items():
-            for pattern in patterns:
-                if any(board_path.rglob(f"*{pattern}*")):
-                    return ip_type
+        Args:
+            board_path: Path to the board directory
+            fpga_part: FPGA part number of the board
+            entry_names: Names of all entries under board_path, if already
+                collected by _scan_board_tree()
+        """
+        if entry_names is None:
+            entry_names = cls._scan_board_tree(board_path).entry_names
+
+        # Scan for IP files; the separator keeps a pattern from matching
+        # across two names
+        names = "\n".join(entry_names)
+        for ip_type, patterns in _PCIE_IP_INDICATORS:
+            if any(pattern in names for pattern in patterns):
+                return ip_type
 
         # Fallback based on FPGA part
         if "xc7a35t" in fpga_part:
@@ -311,80 +540,88 @@ class BoardDiscovery:
             return "pcie_7x"
 
     @classmethod
-    def _find_source_files(cls, board_path: Path) -> List[str]:
-        """Find SystemVerilog/Verilog source files."""
-        src_dirs = [
-            board_path,
-            board_path / "src",
-            board_path / "rtl",
-            board_path / "hdl",
-        ]
-        files = []
-
-        for src_dir in src_dirs:
-            if src_dir.exists():
-                files.extend(sorted(f.name for f in src_dir.glob("*.sv")))
-                files.extend(sorted(f.name for f in src_dir.glob("*.v")))
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_files = []
-        for f in files:
-            if f not in seen:
-                seen.add(f)
-                unique_files.append(f)
-
-        return unique_files
-
-    @classmethod
-    def _find_ip_files(cls, board_path: Path) -> List[str]:
-        """Find IP core files."""
-        ip_dirs = [board_path, board_path / "ip", board_path / "ips"]
-        files = []
-
-        for ip_dir in ip_dirs:
-            if ip_dir.exists():
-                files.extend(sorted(f.name for f in ip_dir.glob("*.xci")))
-                files.extend(sorted(f.name for f in ip_dir.glob("*.xcix")))
-
-        return list(set(files))
-
-    @classmethod
-    def _find_constraint_files(cls, board_path: Path) -> List[str]:
-        """Find constraint files."""
-        xdc_dirs = [
-            board_path,
-            board_path / "constraints",
-            board_path / "xdc",
-            board_path / "src",
-        ]
-        files = []
+    def _scan_board_tree(cls, board_path: Path) -> _BoardScan:
+        """
+        Walk a board directory once and classify the files it contains.
 
-        for xdc_dir in xdc_dirs:
-            if xdc_dir.exists():
-                files.extend(sorted(f.name for f in xdc_dir.glob("*.xdc")))
+        Every subdirectory is listed with a single os.scandir() call; symlinked
+        directories are not descended into, matching Path.rglob().
 
-        return list(set(files))
+        Args:
+            board_path: Path to the board directory
 
-    @classmethod
-    def _find_coefficient_files(cls, board_path: Path) -> List[str]:
-        """Find coefficient files."""
-        coe_dirs = [
-            board_path,
-            board_path / "coe",
-            board_path / "coefficients",
-            board_path / "src",
+        Returns:
+            _BoardScan with the board's source, IP, constraint and coefficient
+            files, the .sv paths to inspect for capabilities, and the names of
+            all entries in the tree
+        """
+        listings: Dict[str, List[str]] = {}
+        entry_names: Set[str] = set()
+        stack = [("", str(board_path))]
+        while stack:
+            rel, path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            listings[rel] = [entry.name for entry in entries]
+            for entry in entries:
+                entry_names.add(entry.name)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    child = f"{rel}/{entry.name}" if rel else entry.name
+                    stack.append((child, entry.path))
+
+        # Candidate directories reached through a symlink were not walked
+        for rel in {
+            *_SRC_DIRS,
+            *_IP_DIRS,
+            *_XDC_DIRS,
+            *_COE_DIRS,
+            *_CONTENT_DIRS,
+        }.difference(listings):
+            try:
+                listings[rel] = os.listdir(board_path / rel)
+            except OSError:
+                pass
+
+        def _matching(dirs: Tuple[str, ...], *suffixes: str) -> List[str]:
+            files = []
+            for rel in dirs:
+                names = listings.get(rel, ())
+                for suffix in suffixes:
+                    files.extend(sorted(n for n in names if n.endswith(suffix)))
+            return files
+
+        sv_paths = [
+            board_path / rel / name
+            for rel in _CONTENT_DIRS
+            for name in listings.get(rel, ())
+            if name.endswith(".sv")
         ]
-        files = []
 
-        for coe_dir in coe_dirs:
-            if coe_dir.exists():
-                files.extend(sorted(f.name for f in coe_dir.glob("*.coe")))
-
-        return list(set(files))
+        # Remove duplicates while preserving the directory search order, so
+        # the file lists are identical from run to run
+        return _BoardScan(
+            src_files=list(dict.fromkeys(_matching(_SRC_DIRS, ".sv", ".v"))),
+            ip_files=list(dict.fromkeys(_matching(_IP_DIRS, ".xci", ".xcix"))),
+            xdc_files=list(dict.fromkeys(_matching(_XDC_DIRS, ".xdc"))),
+            coe_files=list(dict.fromkeys(_matching(_COE_DIRS, ".coe"))),
+            sv_paths=sv_paths,
+            entry_names=entry_names,
+        )
 
     @classmethod
-    def _detect_capabilities(cls, board_path: Path, src_files: List[str]) -> Dict:
+    def _detect_capabilities(
+        cls,
+        board_path: Path,
+        src_files: List[str],
+        sv_paths: Optional[List[Path]] = None,
+    ) -> Dict:
         """Detect board capabilities from source files."""
         capabilities = {
             "supports_msi": False,
@@ -393,47 +630,40 @@ class BoardDiscovery:
             "has_option_rom": False,
         }
 
-        # Check source file names and content
-        msix_patterns = ["msix", "msi_x", "msi-x"]
-        msi_patterns = ["msi", "interrupt"]
-        dma_patterns = ["dma", "tlp", "bar_controller"]
-        rom_patterns = ["option_rom", "expansion_rom", "rom_bar"]
-
-        for src_file in src_files:
-            src_lower = src_file.lower()
-
-            # Check MSI-X support
-            if any(pattern in src_lower for pattern in msix_patterns):
-                capabilities["supports_msix"] = True
-                capabilities["supports_msi"] = True  # MSI-X implies MSI
-            # Check MSI support
-            elif any(pattern in src_lower for pattern in msi_patterns):
-                capabilities["supports_msi"] = True
-
-            # Check DMA support
-            if any(pattern in src_lower for pattern in dma_patterns):
-                capabilities["has_dma"] = True
+        # Check all source file names in one pass; the separator keeps a
+        # pattern from matching across two names
+        names = "\n".join(src_files).lower()
+        if any(pattern in names for pattern in _MSIX_PATTERNS):
+            capabilities["supports_msix"] = True
+            capabilities["supports_msi"] = True  # MSI-X implies MSI
+        elif any(pattern in names for pattern in _MSI_PATTERNS):
+            capabilities["supports_msi"] = True
+        capabilities["has_dma"] = any(pattern in names for pattern in _DMA_PATTERNS)
+        capabilities["has_option_rom"] = any(
+            pattern in names for pattern in _ROM_PATTERNS
+        )
 
-            # Check Option ROM support
-            if any(pattern in src_lower for pattern in rom_patterns):
-                capabilities["has_option_rom"] = True
+        # File contents can only add MSI/MSI-X support; nothing left to learn
+        # once the file names already proved MSI-X
+        if capabilities["supports_msix"]:
+            return capabilities
 
         # Also check file contents for more accurate detection
-        src_dirs = [board_path, board_path / "src", board_path / "rtl"]
-        for src_dir in src_dirs:
-            if src_dir.exists():
-                for sv_file in src_dir.glob("*.sv"):
-                    try:
-                        content = sv_file.read_text(
-                            encoding="utf-8", errors="ignore"
-                        ).lower()
-                        if "msix" in content or "msi_x" in content:
-                            capabilities["supports_msix"] = True
-                            capabilities["supports_msi"] = True
-                        elif "msi" in content and "interrupt" in content:
-                            capabilities["supports_msi"] = True
-                    except Exception:
-                        pass  # Ignore read errors
+        if sv_paths is None:
+            sv_paths = cls._scan_board_tree(board_path).sv_paths
+        for sv_file in sv_paths:
+            try:
+                # The markers are ASCII, so matching raw bytes avoids
+                # decoding the whole file
+                content = sv_file.read_bytes().lower()
+                if b"msix" in content or b"msi_x" in content:
+                    capabilities["supports_msix"] = True
+                    capabilities["supports_msi"] = True
+                    break
+                elif b"msi" in content and b"interrupt" in content:
+                    capabilities["supports_msi"] = True
+            except Exception:
+                pass  # Ignore read errors
 
         return capabilities
 
@@ -450,50 +680,28 @@ class BoardDiscovery:
         Returns:
             List of tuples (board_name, display_info) suitable for UI display
         """
-        display_info = []
-
-        # Recommended boards (based on common usage and features)
-        recommended_boards = {"pcileech_75t484_x1", "pcileech_35t325_x4"}
-
+        recommended = []
+        others = []
         for board_name, config in boards.items():
+            is_recommended = board_name in _RECOMMENDED_BOARDS
             info = {
                 "display_name": cls._format_display_name(board_name),
                 "description": cls._generate_description(config),
-                "is_recommended": board_name in recommended_boards,
+                "is_recommended": is_recommended,
             }
-            display_info.append((board_name, info))
-
-        # Sort with recommended boards first
-        display_info.sort(key=lambda x: (not x[1]["is_recommended"], x[0]))
+            (recommended if is_recommended else others).append((board_name, info))
 
-        return display_info
+        # Recommended boards first, each group sorted by board name
+        recommended.sort(key=itemgetter(0))
+        others.sort(key=itemgetter(0))
+        return recommended + others
 
     @classmethod
     def _format_display_name(cls, board_name: str) -> str:
         """Format board name for display."""
         # Special cases
-        special_names = {
-            "35t": "35T Legacy Board",
-            "75t": "75T Legacy Board",
-            "100t": "100T Legacy Board",
-            "pcileech_75t484_x1": "CaptainDMA 75T",
-            "pcileech_35t484_x1": "CaptainDMA 35T x1",
-            "pcileech_35t325_x4": "CaptainDMA 35T x4",
-            "pcileech_35t325_x1": "CaptainDMA 35T x1 (325)",
-            "pcileech_100t484_x1": "CaptainDMA 100T",
-            "pcileech_100t484_x4": "Artix-7 100T x4 (ZDMA-style)",
-            "pcileech_enigma_x1": "CaptainDMA Enigma x1",
-            "pcileech_squirrel": "CaptainDMA Squirrel",
-            "pcileech_pciescreamer_xc7a35": "PCIeScreamer XC7A35",
-            "pcileech_gbox": "GBOX (Thunderbolt3)",
-            "pcileech_netv2_35t": "NeTV2 35T (UDP/IP)",
-            "pcileech_netv2_100t": "NeTV2 100T (UDP/IP)",
-            "pcileech_screamer_m2": "ScreamerM2 (M.2)",
-            "pcileech_ac701": "AC701/FT601 Dev Board",
-        }
-
-        if board_name in special_names:
-            return special_names[board_name]
+        if board_name in _SPECIAL_DISPLAY_NAMES:
+            return _SPECIAL_DISPLAY_NAMES[board_name]
 
         # Generic formatting
         name = board_name.replace("pcileech_", "").replace("_", " ").title()
@@ -539,22 +747,17 @@ class BoardDiscovery:
             boards: Dictionary of discovered boards
             output_file: Path to output JSON file
         """
-        # Convert Path objects to strings for JSON serialization
-        export_data = {}
-        for board_name, config in boards.items():
-            export_config = config.copy()
-            # Convert lists to ensure they're JSON serializable
-            for key in ["src_files", "ip_files", "xdc_files", "coe_files"]:
-                if key in export_config:
-                    export_config[key] = list(export_config[key])
-            export_data[board_name] = export_config
+        # Board configs only hold JSON-native values (file lists are List[str]),
+        # so they are serialized as-is; encoding in one call and writing the
+        # result once is cheaper than json.dump()'s many small writes
+        payload = json.dumps(boards, indent=2, sort_keys=True)
 
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Atomic write: write to temp file and replace
         tmp = output_file.with_suffix(output_file.suffix + ".tmp")
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, sort_keys=True)
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
         tmp.replace(output_file)
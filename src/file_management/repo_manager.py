@@ -10,9 +10,13 @@ and retrieve board paths and XDC files for various PCILeech boards.
 from __future__ import annotations
 
 import os as _os
+import shutil as _shutil
 import subprocess as _sp
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
 
 from ..log_config import get_logger
 from ..string_utils import log_debug_safe, log_error_safe, log_info_safe, safe_format
@@ -68,6 +72,35 @@ def _get_voltcyclone_fpga_path() -> Path:
 # Compute the submodule path dynamically
 SUBMODULE_PATH = _get_voltcyclone_fpga_path()
 
+# Upper bound on threads reading a board's XDC files
+_MAX_XDC_READERS = 8
+
+# Board type -> board directory components below the voltcyclone-fpga root
+# (read-only)
+_BOARD_SUBPATHS = MappingProxyType({
+    "35t": ("PCIeSquirrel",),
+    "75t": ("EnigmaX1",),
+    "100t": ("ZDMA",),
+    # CaptainDMA variants
+    "pcileech_75t484_x1": ("CaptainDMA", "75t484_x1"),
+    "pcileech_35t484_x1": ("CaptainDMA", "35t484_x1"),
+    "pcileech_35t325_x4": ("CaptainDMA", "35t325_x4"),
+    "pcileech_35t325_x1": ("CaptainDMA", "35t325_x1"),
+    "pcileech_100t484_x1": ("CaptainDMA", "100t484-1"),
+    "pcileech_100t484_x4": ("ZDMA", "100T"),
+    # Other boards
+    "pcileech_enigma_x1": ("EnigmaX1",),
+    "pcileech_squirrel": ("PCIeSquirrel",),
+    "pcileech_pciescreamer_xc7a35": ("pciescreamer",),
+    # Commercial PCILeech boards
+    "pcileech_gbox": ("GBOX",),
+    "pcileech_netv2_35t": ("NeTV2",),
+    "pcileech_netv2_100t": ("NeTV2",),
+    "pcileech_screamer_m2": ("ScreamerM2",),
+    # Development boards
+    "pcileech_ac701": ("ac701_ft601",),
+})
+
 ###############################################################################
 # Logging setup
 ###############################################################################
@@ -135,8 +168,15 @@ def _run(
     return _sp.run(cmd, **kwargs)
 
 
-def _git_available() -> bool:
-    """Return *True* if ``git`` is callable in the PATH."""
+@lru_cache(maxsize=None)
+def _git_available(strict: bool = False) -> bool:
+    """Return *True* if ``git`` is callable in the PATH.
+
+    By default only the PATH is searched; *strict* also runs ``git --version``
+    to prove the binary works. Results are cached for the process lifetime.
+    """
+    if not strict:
+        return _shutil.which("git") is not None
     try:
         # Suppress output to avoid noise in logs during validation
         _run(
@@ -149,6 +189,42 @@ def _git_available() -> bool:
         return False
 
 
+def _resolve_git_dir(dot_git: Path) -> Optional[Path]:
+    """Return the git directory behind a ``.git`` entry, or None if unknown.
+
+    ``.git`` is either the git directory itself or, for submodules and
+    worktrees, a file containing ``gitdir: <path>``.
+    """
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        first_line = dot_git.read_text(encoding="utf-8").splitlines()[0]
+    except (OSError, UnicodeDecodeError, IndexError):
+        return None
+    if not first_line.startswith("gitdir:"):
+        return None
+    target = dot_git.parent / first_line[len("gitdir:"):].strip()
+    return target if target.is_dir() else None
+
+
+def _read_head_commit(git_dir: Path) -> Optional[str]:
+    """Read the HEAD commit from *git_dir* without running git.
+
+    Handles a detached HEAD and a HEAD pointing at a loose ref; returns None
+    for anything else (packed refs, unborn branches, worktree common dirs).
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if head.startswith("ref:"):
+            ref = head[len("ref:"):].strip()
+            head = (git_dir / ref).read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(head) in (40, 64) and all(c in "0123456789abcdef" for c in head):
+        return head
+    return None
+
+
 ###############################################################################
 # Public API
 ###############################################################################
@@ -162,6 +238,17 @@ class RepoManager:
             "RepoManager may not be instantiated; call class methods only"
         )
 
+    # Resolved paths already validated by ensure_repo() / _is_valid_repo();
+    # only successful checks are remembered
+    _ensured_paths: Set[Path] = set()
+    _valid_repo_paths: Set[Path] = set()
+    # HEAD commit per resolved checkout path, filled by _is_valid_repo() and
+    # head_commit()
+    _head_commits: Dict[Path, str] = {}
+    # Board constraint lookups keyed by (board type, resolved repository root)
+    _xdc_files_cache: Dict[Tuple[str, Path], Tuple[Path, ...]] = {}
+    _combined_xdc_cache: Dict[Tuple[str, Path], str] = {}
+
     # ---------------------------------------------------------------------
     # Entry points
     # ---------------------------------------------------------------------
@@ -178,7 +265,11 @@ class RepoManager:
         - Must contain required board directories.
 
         Any deviation raises RuntimeError with remediation instructions.
+        Successful validation is remembered until invalidate_cache().
         """
+        if SUBMODULE_PATH.resolve() in cls._ensured_paths:
+            return SUBMODULE_PATH
+
         if not SUBMODULE_PATH.exists():
             # Provide context-aware error message
             if _is_container_env():
@@ -227,20 +318,33 @@ class RepoManager:
             path=SUBMODULE_PATH,
             prefix="REPO",
         )
+        cls._ensured_paths.add(SUBMODULE_PATH.resolve())
         return SUBMODULE_PATH
 
     @classmethod
     
+    def invalidate_cache(cls) -> None:
+        """Forget validated repository paths and everything cached for them."""
+        cls._ensured_paths.clear()
+        cls._valid_repo_paths.clear()
+        cls._head_commits.clear()
+        cls._xdc_files_cache.clear()
+        cls._combined_xdc_cache.clear()
+
+    @classmethod
+    
     def update_submodule(cls) -> None:
         """Update the voltcyclone-fpga submodule to latest upstream changes.
 
         Raises:
             RuntimeError: If git is not available or update fails
         """
-        if not _git_available():
+        if not _git_available(strict=True):
             raise RuntimeError("git executable not available for submodule update")
         
         log_info_safe(_logger, "Updating voltcyclone-fpga submodule...")
+        # The checkout is about to change; validate it afresh next time
+        cls.invalidate_cache()
         
         try:
             # Update submodule to latest commit from tracked branch
@@ -266,39 +370,17 @@ class RepoManager:
         cls, board_type: str, *, repo_root: Optional[Path] = None
     ) -> Path:
         repo_root = repo_root or cls.ensure_repo()
-        mapping = {
-            "35t": repo_root / "PCIeSquirrel",
-            "75t": repo_root / "EnigmaX1",
-            "100t": repo_root / "ZDMA",
-            # CaptainDMA variants
-            "pcileech_75t484_x1": repo_root / "CaptainDMA" / "75t484_x1",
-            "pcileech_35t484_x1": repo_root / "CaptainDMA" / "35t484_x1",
-            "pcileech_35t325_x4": repo_root / "CaptainDMA" / "35t325_x4",
-            "pcileech_35t325_x1": repo_root / "CaptainDMA" / "35t325_x1",
-            "pcileech_100t484_x1": repo_root / "CaptainDMA" / "100t484-1",
-            "pcileech_100t484_x4": repo_root / "ZDMA" / "100T",
-            # Other boards
-            "pcileech_enigma_x1": repo_root / "EnigmaX1",
-            "pcileech_squirrel": repo_root / "PCIeSquirrel",
-            "pcileech_pciescreamer_xc7a35": repo_root / "pciescreamer",
-            # Commercial PCILeech boards
-            "pcileech_gbox": repo_root / "GBOX",
-            "pcileech_netv2_35t": repo_root / "NeTV2",
-            "pcileech_netv2_100t": repo_root / "NeTV2",
-            "pcileech_screamer_m2": repo_root / "ScreamerM2",
-            # Development boards
-            "pcileech_ac701": repo_root / "ac701_ft601",
-        }
         try:
-            path = mapping[board_type]
+            subpath = _BOARD_SUBPATHS[board_type]
         except KeyError as exc:
             raise RuntimeError(
                 (
                     "Unknown board type '{bt}'.  Known types: {known}".format(
-                        bt=board_type, known=", ".join(mapping)
+                        bt=board_type, known=", ".join(_BOARD_SUBPATHS)
                     )
                 )
             ) from exc
+        path = repo_root.joinpath(*subpath)
         if not path.exists():
             raise RuntimeError(
                 (
@@ -313,16 +395,30 @@ class RepoManager:
     def get_xdc_files(
         cls, board_type: str, *, repo_root: Optional[Path] = None
     ) -> List[Path]:
+        """Return the board's XDC files; the list is cached per repository."""
+        repo_root = repo_root or cls.ensure_repo()
+        key = (board_type, repo_root.resolve())
+        cached = cls._xdc_files_cache.get(key)
+        if cached is None:
+            cached = cls._find_xdc_files(board_type, repo_root)
+            cls._xdc_files_cache[key] = cached
+        return list(cached)
+
+    @classmethod
+    
+    def _find_xdc_files(cls, board_type: str, repo_root: Path) -> Tuple[Path, ...]:
+        """Uncached XDC file search behind get_xdc_files()."""
         board_dir = cls.get_board_path(board_type, repo_root=repo_root)
-        search_roots = [
-            board_dir,
+        # A recursive glob of the board directory already covers src/,
+        # constraints/ and xdc/; those only need their own walk when they are
+        # symlinks, which the recursive glob does not follow
+        xdc: list[Path] = sorted(board_dir.glob("**/*.xdc"))
+        for root in (
             board_dir / "src",
             board_dir / "constraints",
             board_dir / "xdc",
-        ]
-        xdc: list[Path] = []
-        for root in search_roots:
-            if root.exists():
+        ):
+            if root.is_symlink() and root.exists():
                 xdc.extend(sorted(root.glob("**/*.xdc")))
         if not xdc:
             raise RuntimeError(
@@ -332,25 +428,31 @@ class RepoManager:
                 )
             )
         # De‑duplicate whilst preserving order
-        seen: set[Path] = set()
-        uniq: list[Path] = []
-        for p in xdc:
-            if p not in seen:
-                uniq.append(p)
-                seen.add(p)
-        return uniq
+        return tuple(dict.fromkeys(xdc))
 
     @classmethod
     
     def read_combined_xdc(
         cls, board_type: str, *, repo_root: Optional[Path] = None
     ) -> str:
-        files = cls.get_xdc_files(board_type, repo_root=repo_root)
+        """Return all board XDC files joined; the text is cached per repository."""
+        root = repo_root or cls.ensure_repo()
+        key = (board_type, root.resolve())
+        combined = cls._combined_xdc_cache.get(key)
+        if combined is None:
+            combined = cls._combine_xdc(board_type, root)
+            cls._combined_xdc_cache[key] = combined
+        return combined
+
+    @classmethod
+    
+    def _combine_xdc(cls, board_type: str, root: Path) -> str:
+        """Uncached concatenation behind read_combined_xdc()."""
+        files = cls.get_xdc_files(board_type, repo_root=root)
         parts = [
             f"# XDC constraints for {board_type}",
             f"# Sources: {[f.name for f in files]}",
         ]
-        root = repo_root or cls.ensure_repo()
         
         def _safe_rel(fp: Path, root: Path) -> str:
             """Get safe relative path for display."""
@@ -359,9 +461,22 @@ class RepoManager:
             except (ValueError, RuntimeError):
                 return fp.name
         
-        for fp in files:
+        def _read(fp: Path) -> str:
+            return fp.read_text(encoding="utf-8")
+
+        # Boards with several constraint files read them concurrently; map()
+        # keeps the results in file order
+        if len(files) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_XDC_READERS, len(files))
+            ) as executor:
+                contents = list(executor.map(_read, files))
+        else:
+            contents = [_read(fp) for fp in files]
+
+        for fp, content in zip(files, contents):
             parts.append(f"\n# ==== {_safe_rel(fp, root)} ====")
-            parts.append(fp.read_text(encoding="utf-8"))
+            parts.append(content)
         return "\n".join(parts)
 
     # ------------------------------------------------------------------
@@ -370,6 +485,36 @@ class RepoManager:
 
     @classmethod
     
+    def head_commit(cls, path: Path) -> Optional[str]:
+        """Return the commit checked out at *path*, or None if unknown.
+
+        Only a checkout with its own ``.git`` entry is considered, so a
+        vendored copy inside another repository does not report the parent
+        repository's commit.
+        """
+        if not (path / ".git").exists():
+            return None
+
+        resolved = path.resolve()
+        if resolved in cls._head_commits:
+            return cls._head_commits[resolved]
+
+        try:
+            result = _run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=path,
+                env={**_os.environ, "GIT_TERMINAL_PROMPT": "0"},
+                capture_output=True,
+            )
+        except Exception:
+            return None
+        head = result.stdout.strip() or None
+        if head is not None:
+            cls._head_commits[resolved] = head
+        return head
+
+    @classmethod
+    
     def _is_valid_repo(cls, path: Path) -> bool:
         """Check if path contains a valid voltcyclone-fpga repository.
         
@@ -377,6 +522,19 @@ class RepoManager:
         COPY operations, so we validate by checking for required board directories
         instead. This is safe because the container builds clone the repo fresh.
         """
+        resolved = path.resolve()
+        if resolved in cls._valid_repo_paths:
+            return True
+
+        valid = cls._check_repo(path)
+        if valid:
+            cls._valid_repo_paths.add(resolved)
+        return valid
+
+    @classmethod
+    
+    def _check_repo(cls, path: Path) -> bool:
+        """Uncached validation behind _is_valid_repo()."""
         # In container mode, skip git validation and check for required content
         if _is_container_env():
             # Validate by checking for required board directories
@@ -395,20 +553,45 @@ class RepoManager:
         if not git_dir.exists():
             return False
 
+        # Common case: .git (or the directory a submodule's .git file points
+        # to) holds a HEAD file, which is what rev-parse would find
+        resolved_git_dir = _resolve_git_dir(git_dir)
+        if resolved_git_dir is not None and (resolved_git_dir / "HEAD").is_file():
+            head = _read_head_commit(resolved_git_dir)
+            if head is not None:
+                cls._head_commits[path.resolve()] = head
+            return True
+
         if not _git_available():
             return True
 
         try:
-            # Suppress output to avoid "fatal: not a git repository" errors
-            # when .git points to unavailable submodule metadata in containers
-            _run(
-                ["git", "rev-parse", "--git-dir"], 
-                cwd=path, 
-                suppress_output=True
+            # One rev-parse both validates the repository and reports HEAD for
+            # head_commit(); captured output also hides "fatal: not a git
+            # repository" errors when .git points to unavailable submodule
+            # metadata in containers
+            result = _run(
+                ["git", "rev-parse", "--git-dir", "HEAD"],
+                cwd=path,
+                capture_output=True,
             )
-            return True
         except Exception:
-            return False
+            # HEAD does not resolve in a repository without commits, which
+            # is still a valid repository
+            try:
+                _run(
+                    ["git", "rev-parse", "--git-dir"], 
+                    cwd=path, 
+                    suppress_output=True
+                )
+                return True
+            except Exception:
+                return False
+
+        lines = result.stdout.split()
+        if len(lines) > 1:
+            cls._head_commits[path.resolve()] = lines[-1]
+        return True
 
     @classmethod
     
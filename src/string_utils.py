@@ -173,6 +173,9 @@ def safe_log_format(
     **kwargs: Any,
 ) -> None:
     """Log a formatted message with level-padded prefix and timestamp."""
+    # Skip formatting entirely when the record would be dropped anyway.
+    if not logger.isEnabledFor(log_level):
+        return
     try:
         formatted_message = safe_format(template, prefix=prefix, **kwargs)
         level_map = {
@@ -16,6 +16,9 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
+# ANSI escape sequences (CSI and two-character forms) emitted by the formatter
+_ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 class VivadoErrorType(Enum):
     """Types of Vivado errors."""
@@ -796,8 +799,10 @@ class VivadoErrorReporter:
 
     def _strip_ansi_codes(self, text: str) -> str:
         """Remove ANSI color codes from text."""
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        # Every escape sequence starts with ESC; plain text needs no regex pass
+        if "\x1b" not in text:
+            return text
+        return _ANSI_ESCAPE_RE.sub("", text)
 
     def print_summary(
         self, errors: List[VivadoError], warnings: List[VivadoError]
@@ -3,6 +3,7 @@
 Unit tests for BarContentGenerator (BAR entropy and uniqueness).
 """
 import hashlib
+import struct
 
 import pytest
 
@@ -110,3 +111,41 @@ def test_buffer_prefix_property_for_shake256():
     assert len(data_small) == small
     assert len(data_big) == big
     assert data_big[:small] == data_small
+
+
+def test_register_content_overlay_per_block():
+    """Each 64-byte register block carries the fixed control/status/ID bits,
+    and a trailing partial dword is left as raw seeded bytes."""
+    gen = BarContentGenerator(device_signature="reg-overlay-sig-003")
+    size = 4096 + 2
+    data = gen.generate_bar_content(size, 0, BarContentType.REGISTERS)
+    base = gen._get_seeded_bytes(size, "reg_bar0")
+
+    for block in range(0, 4096, 64):
+        ctrl, status, ident = struct.unpack_from("<III", data, block)
+        assert ctrl & 0x7 == 0x1
+        assert status & 0xFF == 0x80
+        assert ident & 0xFFFF == 0x1234
+        assert data[block + 24 : block + 64] == base[block + 24 : block + 64]
+    assert data[4096:] == base[4096:]
+
+
+def test_generate_all_bars_skips_stats_when_info_disabled(monkeypatch):
+    """Per-BAR entropy stats are only computed for the INFO summary line."""
+    import logging
+
+    from pcileechfwgenerator.device_clone import bar_content_generator as bcg
+
+    monkeypatch.setattr(
+        bcg.logger, "isEnabledFor", lambda level: level >= logging.WARNING
+    )
+    gen = BarContentGenerator(device_signature="quiet-allbars")
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("entropy stats computed with INFO disabled")
+
+    monkeypatch.setattr(gen, "get_entropy_stats", _fail)
+    monkeypatch.setattr(gen, "_visualize_bar_content", _fail)
+
+    bars = gen.generate_all_bars({0: 4096, 1: 65536})
+    assert {idx: len(data) for idx, data in bars.items()} == {0: 4096, 1: 65536}
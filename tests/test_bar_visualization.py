@@ -197,3 +197,123 @@ class TestBarVisualization:
             # Verify entropy is reasonable
             stats = gen.get_entropy_stats(content)
             assert stats["entropy"] > 5.0, f"{content_type} should have decent entropy"
+
+    def test_entropy_numpy_matches_counter_fallback(self, monkeypatch):
+        """NumPy histogram path agrees with the pure-Python fallback."""
+        pytest.importorskip("numpy")
+        from pcileechfwgenerator.device_clone import bar_content_generator as bcg
+
+        gen = BarContentGenerator(device_signature="test-numpy-parity")
+        samples = [
+            bytes(1024),
+            bytes(range(256)) * 4,
+            gen.generate_bar_content(65536, 0, BarContentType.MIXED),
+        ]
+
+        fast = [gen.get_entropy_stats(data) for data in samples]
+        monkeypatch.setattr(bcg, "_numpy_module", lambda: None)
+        slow = [gen.get_entropy_stats(data) for data in samples]
+
+        for f, s in zip(fast, slow):
+            assert f["unique_bytes"] == s["unique_bytes"]
+            assert f["entropy"] == pytest.approx(s["entropy"])
+        assert fast[0]["entropy"] == 0.0
+        assert fast[1]["entropy"] == 8.0
+
+    def test_visualize_skips_sampling_when_info_disabled(self, monkeypatch):
+        """No entropy work is done when INFO output would be dropped."""
+        import logging
+
+        from pcileechfwgenerator.device_clone import bar_content_generator as bcg
+
+        monkeypatch.setattr(
+            bcg.logger, "isEnabledFor", lambda level: level >= logging.WARNING
+        )
+        gen = BarContentGenerator(device_signature="test-viz-disabled")
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("entropy computed with INFO disabled")
+
+        monkeypatch.setattr(gen, "get_entropy_stats", _fail)
+        monkeypatch.setattr(gen, "_calculate_entropy", _fail)
+
+        gen._visualize_bar_content(bytes(8192), 0)
+
+    def test_optional_imports_deferred_until_used(self):
+        """NumPy and Rich are not imported just by loading the module."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import pcileechfwgenerator.device_clone.bar_content_generator\n"
+            "print('numpy' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_ascii_fallback_when_rich_unavailable(self, monkeypatch):
+        """ASCII renderer is used when Rich cannot be imported."""
+        from pcileechfwgenerator.device_clone import bar_content_generator as bcg
+
+        monkeypatch.setattr(bcg, "_rich_available", lambda: False)
+        monkeypatch.setattr(bcg.logger, "isEnabledFor", lambda level: True)
+        gen = BarContentGenerator(device_signature="test-no-rich")
+        rendered = []
+        monkeypatch.setattr(
+            gen, "_render_ascii_entropy", lambda samples, idx: rendered.append(idx)
+        )
+        monkeypatch.setattr(
+            gen,
+            "_render_rich_entropy",
+            lambda *_: pytest.fail("Rich renderer used without Rich"),
+        )
+
+        gen._visualize_bar_content(bytes(range(256)) * 32, 3)
+        assert rendered == [3]
+
+    def test_rich_entropy_single_print_with_cached_console(self):
+        """Rich rendering emits one print per BAR and reuses its Console."""
+        pytest.importorskip("rich")
+        gen = BarContentGenerator(device_signature="test-rich-batch")
+        samples = [(0x0000, 7.8), (0x1000, 6.5), (0x2000, 5.2)]
+
+        printed = []
+
+        class _Console:
+            def print(self, renderable):
+                printed.append(renderable)
+
+        gen._console = _Console()
+        gen._render_rich_entropy(samples, 0)
+        gen._render_rich_entropy(samples, 1)
+
+        assert len(printed) == 2
+        lines = printed[0].plain.split("\n")
+        assert lines == [
+            "  ✓ 0x00000000: " + "█" * 39 + " 7.80",
+            "  ~ 0x00001000: " + "▓" * 32 + " 6.50",
+            "  ! 0x00002000: " + "▒" * 26 + " 5.20",
+        ]
+
+    def test_ascii_entropy_single_log_record(self, monkeypatch):
+        """ASCII rendering logs all samples of a BAR in one record."""
+        from pcileechfwgenerator.device_clone import bar_content_generator as bcg
+
+        messages = []
+        monkeypatch.setattr(
+            bcg,
+            "log_info_safe",
+            lambda _logger, template, **kwargs: messages.append(template),
+        )
+        gen = BarContentGenerator(device_signature="test-ascii-batch")
+        gen._render_ascii_entropy([(0x0000, 7.8), (0x1000, 6.5), (0x2000, 5.0)], 0)
+
+        assert len(messages) == 1
+        assert messages[0].split("\n") == [
+            "  ✓ 0x00000000: " + "█" * 39 + " 7.80",
+            "  ~ 0x00001000: " + "▓" * 32 + " 6.50",
+            "  ! 0x00002000: " + "░" * 25 + " 5.00",
+        ]
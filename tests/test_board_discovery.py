@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Unit tests for BoardDiscovery filesystem scanning."""
+
+from pathlib import Path
+
+import pytest
+
+from pcileechfwgenerator.file_management import board_discovery as bd
+from pcileechfwgenerator.file_management.board_discovery import BoardDiscovery
+
+
+@pytest.fixture(autouse=True)
+def _clear_discovery_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(bd, "_BOARD_CACHE_FILE", tmp_path / "cache" / "boards.json")
+    BoardDiscovery.clear_cache()
+    yield
+    BoardDiscovery.clear_cache()
+
+
+def _make_repo(tmp_path):
+    repo_root = tmp_path / "voltcyclone-fpga"
+    board = repo_root / "CaptainDMA" / "75t484_x1"
+    (board / "src").mkdir(parents=True)
+    (board / "src" / "pcileech_msix_table.sv").write_text("module m; endmodule\n")
+    (board / "src" / "pcileech_fifo.sv").write_text("module f; endmodule\n")
+    (board / "src" / "pcileech.xdc").write_text("")
+    (board / "ip").mkdir()
+    (board / "ip" / "pcie_7x_0.xci").write_text("")
+    return repo_root
+
+
+def test_discover_boards_memoized_per_repo(tmp_path, monkeypatch):
+    repo_root = _make_repo(tmp_path)
+    calls = []
+    original = BoardDiscovery._analyze_board.__func__
+
+    def _counting(cls, *args):
+        calls.append(args[0])
+        return original(cls, *args)
+
+    monkeypatch.setattr(BoardDiscovery, "_analyze_board", classmethod(_counting))
+
+    first = BoardDiscovery.discover_boards(repo_root)
+    first["pcileech_75t484_x1"]["src_files"].append("mutated.sv")
+    second = BoardDiscovery.discover_boards(repo_root)
+
+    assert calls == ["pcileech_75t484_x1"]
+    assert "mutated.sv" not in second["pcileech_75t484_x1"]["src_files"]
+
+    # A new top-level entry changes the repo mtime and invalidates the cache
+    (repo_root / "GBOX").mkdir()
+    third = BoardDiscovery.discover_boards(repo_root)
+    assert "pcileech_gbox" in third
+
+
+def test_analyze_board_classifies_files_in_one_walk(tmp_path):
+    repo_root = _make_repo(tmp_path)
+    board = repo_root / "CaptainDMA" / "75t484_x1"
+
+    scan = BoardDiscovery._scan_board_tree(board)
+    assert scan.src_files == ["pcileech_fifo.sv", "pcileech_msix_table.sv"]
+    assert scan.ip_files == ["pcie_7x_0.xci"]
+    assert scan.xdc_files == ["pcileech.xdc"]
+    assert scan.coe_files == []
+    assert {"src", "ip", "pcie_7x_0.xci"} <= scan.entry_names
+
+    boards = BoardDiscovery.discover_boards(repo_root)
+    config = boards["pcileech_75t484_x1"]
+    assert config["pcie_ip_type"] == "pcie_7x"
+    assert config["supports_msix"] is True
+    assert config["src_files"] == scan.src_files
+
+
+def test_capabilities_skip_content_reads_when_names_show_msix(tmp_path, monkeypatch):
+    repo_root = _make_repo(tmp_path)
+    board = repo_root / "CaptainDMA" / "75t484_x1"
+    scan = BoardDiscovery._scan_board_tree(board)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("source contents read after MSI-X was detected")
+
+    monkeypatch.setattr(Path, "read_bytes", _fail)
+    caps = BoardDiscovery._detect_capabilities(board, scan.src_files, scan.sv_paths)
+
+    assert caps["supports_msix"] is True
+    assert caps["supports_msi"] is True
+
+
+def test_capabilities_from_file_names():
+    caps = BoardDiscovery._detect_capabilities(
+        Path("unused"),
+        ["src/pcileech_tlps128_bar_controller.sv", "src/option_rom.sv"],
+        [],
+    )
+    assert caps == {
+        "supports_msi": False,
+        "supports_msix": False,
+        "has_dma": True,
+        "has_option_rom": True,
+    }
+
+    # A pattern split across two names is not a match
+    caps = BoardDiscovery._detect_capabilities(
+        Path("unused"), ["src/a_ms", "ix.sv"], []
+    )
+    assert caps["supports_msix"] is False
+
+
+def test_discover_boards_skips_missing_and_non_directory_entries(tmp_path):
+    repo_root = _make_repo(tmp_path)
+    (repo_root / "ZDMA").write_text("not a directory")
+    (tmp_path / "netv2").mkdir()
+    (repo_root / "NeTV2").symlink_to(tmp_path / "netv2", target_is_directory=True)
+
+    boards = BoardDiscovery.discover_boards(repo_root)
+
+    found = {
+        name: config["dir"]
+        for name, config in BoardDiscovery.BOARD_CONFIGS.items()
+        if name in boards
+    }
+    assert set(found.values()) == {"CaptainDMA/75t484_x1", "NeTV2"}
+
+
+def test_export_board_config_round_trips(tmp_path):
+    import json
+
+    boards = BoardDiscovery.discover_boards(_make_repo(tmp_path))
+    output_file = tmp_path / "out" / "boards.json"
+
+    BoardDiscovery.export_board_config(boards, output_file)
+
+    text = output_file.read_text(encoding="utf-8")
+    assert text == json.dumps(boards, indent=2, sort_keys=True)
+    assert json.loads(text) == boards
+    assert not output_file.with_suffix(".json.tmp").exists()
+
+
+def test_discover_boards_persists_per_commit(tmp_path, monkeypatch):
+    repo_root = _make_repo(tmp_path)
+    head = ["abc123"]
+    monkeypatch.setattr(
+        bd.RepoManager, "head_commit", classmethod(lambda cls, path: head[0])
+    )
+
+    boards = BoardDiscovery.discover_boards(repo_root)
+    assert bd._BOARD_CACHE_FILE.exists()
+
+    # A new process only has the on-disk cache
+    BoardDiscovery._discover_cache.clear()
+    monkeypatch.setattr(
+        BoardDiscovery,
+        "_analyze_board",
+        classmethod(lambda cls, *args: pytest.fail("board rescanned")),
+    )
+    assert BoardDiscovery.discover_boards(repo_root) == boards
+
+    # A different commit invalidates the stored result
+    BoardDiscovery._discover_cache.clear()
+    head[0] = "def456"
+    with pytest.raises(pytest.fail.Exception, match="board rescanned"):
+        BoardDiscovery.discover_boards(repo_root)
+
+
+def test_discover_boards_without_commit_skips_disk_cache(tmp_path):
+    BoardDiscovery.discover_boards(_make_repo(tmp_path))
+    assert not bd._BOARD_CACHE_FILE.exists()
+
+
+def test_scan_board_tree_dedups_in_search_order(tmp_path):
+    board = tmp_path / "board"
+    (board / "ip").mkdir(parents=True)
+    (board / "ips").mkdir()
+    (board / "a.xci").write_text("")
+    (board / "ip" / "b.xci").write_text("")
+    (board / "ips" / "a.xci").write_text("")
+    (board / "ips" / "c.xcix").write_text("")
+
+    scan = BoardDiscovery._scan_board_tree(board)
+
+    assert scan.ip_files == ["a.xci", "b.xci", "c.xcix"]
+
+
+def test_board_display_info_lists_recommended_first():
+    boards = {
+        "pcileech_squirrel": {"fpga_part": "xc7a35tcsg324-2"},
+        "pcileech_75t484_x1": {"fpga_part": "xc7a75tfgg484-2", "supports_msix": True},
+        "pcileech_custom_board": {},
+        "pcileech_35t325_x4": {"fpga_part": "xc7a35tcsg324-2"},
+    }
+
+    info = BoardDiscovery.get_board_display_info(boards)
+
+    assert [name for name, _ in info] == [
+        "pcileech_35t325_x4",
+        "pcileech_75t484_x1",
+        "pcileech_custom_board",
+        "pcileech_squirrel",
+    ]
+    assert [entry["is_recommended"] for _, entry in info] == [True, True, False, False]
+    assert info[1][1]["display_name"] == "CaptainDMA 75T"
+    assert info[2][1]["display_name"] == "Custom Board"
+
+
+def test_capabilities_from_file_contents(tmp_path):
+    board = tmp_path / "board"
+    (board / "src").mkdir(parents=True)
+    (board / "src" / "core.sv").write_bytes(
+        "// caf\u00e9 \xff\n".encode("utf-8") + b"\xff\xfe wire MSI; // Interrupt\n"
+    )
+    scan = BoardDiscovery._scan_board_tree(board)
+
+    caps = BoardDiscovery._detect_capabilities(board, scan.src_files, scan.sv_paths)
+    assert caps["supports_msi"] is True
+    assert caps["supports_msix"] is False
+
+    (board / "src" / "table.sv").write_text("module Msi_X_table; endmodule\n")
+    scan = BoardDiscovery._scan_board_tree(board)
+    caps = BoardDiscovery._detect_capabilities(
+        board, ["src/core.sv", "src/table.sv"], scan.sv_paths
+    )
+    assert caps["supports_msix"] is True
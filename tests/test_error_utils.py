@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Unit tests for error categorization and formatting helpers."""
+
+from pcileechfwgenerator.error_utils import ErrorCategory, categorize_error
+
+
+def test_msix_table_size_suggestion():
+    exc = ValueError("MSI-X table size 4096 must be between 1 and 2048")
+    category, suggestion = categorize_error(exc)
+
+    assert category is ErrorCategory.MSIX
+    assert "MSI-X table size is out of range" in suggestion
+
+
+def test_table_size_bound_matches_within_a_line_only():
+    from pcileechfwgenerator.error_utils import _phrases_on_one_line
+
+    def bound(text):
+        return _phrases_on_one_line(text, "table size ", "must be")
+
+    assert bound("table size 9 must be <= 8")
+    assert bound("bad\ntable size 9 must be <= 8")
+    assert not bound("table size 9\nmust be <= 8")
+    assert not bound("must be set before table size 9")
+
+
+def test_msix_tips_follow_rule_order():
+    from pcileechfwgenerator.error_utils import _msix_tips
+
+    tips = _msix_tips("Failed to read MSI-X: invalid MSI-X PBA BIR, not aligned")
+
+    assert [t.split(";")[0].split(" ")[0] for t in tips] == [
+        "Config",
+        "Confirm",
+        "BIR",
+        "MSI-X",
+        "Re-run",
+        "Use",
+    ]
+    assert "capability validation failed" in _msix_tips("msix broke")[0]
+
+
+def test_categorize_error_memoizes_by_type_and_text():
+    from pcileechfwgenerator.error_utils import _categorize_cached
+
+    _categorize_cached.cache_clear()
+    first = categorize_error(FileNotFoundError("missing.bin"))
+    second = categorize_error(FileNotFoundError("missing.bin"))
+
+    assert first[0] is ErrorCategory.PERMISSION
+    assert second is first
+    assert _categorize_cached.cache_info().hits == 1
+
+    # Same text but an unrelated type must not reuse the cached result
+    assert categorize_error(RuntimeError("missing.bin"))[0] is ErrorCategory.UNKNOWN
+
+
+def test_categorize_error_uses_root_cause():
+    try:
+        try:
+            raise OSError("Permission denied: /dev/vfio/1")
+        except OSError as inner:
+            raise RuntimeError("device open failed") from inner
+    except RuntimeError as outer:
+        category, _ = categorize_error(outer)
+
+    assert category is ErrorCategory.PERMISSION
+
+
+def test_exception_chain_helpers():
+    from pcileechfwgenerator.error_utils import (
+        extract_exception_chain,
+        extract_root_cause,
+    )
+
+    root = OSError("root")
+    middle = ValueError("middle")
+    middle.__cause__ = root
+    top = RuntimeError("top")
+    top.__cause__ = middle
+
+    assert extract_exception_chain(top) == ["top", "middle", "root"]
+    assert extract_root_cause(top) == "root"
+    assert extract_root_cause(root) == "root"
+
+
+def test_categorize_error_accepts_precomputed_root_cause():
+    exc = RuntimeError("device open failed")
+
+    assert categorize_error(exc)[0] is ErrorCategory.UNKNOWN
+    category, _ = categorize_error(exc, root_cause="Permission denied")
+    assert category is ErrorCategory.PERMISSION
+
+
+def test_fixed_categories_return_shared_results():
+    a = categorize_error(ValueError("bad data in row 1"))
+    b = categorize_error(KeyError("failed to parse field"))
+
+    assert a[0] is ErrorCategory.DATA
+    assert a is b
+
+
+def test_msix_detected_from_chained_root_cause():
+    top = RuntimeError("capability validation failed")
+    top.__cause__ = ValueError("MSIX table BIR out of range")
+
+    assert categorize_error(top)[0] is ErrorCategory.MSIX
+
+
+def test_format_user_friendly_error_layout():
+    from pcileechfwgenerator.error_utils import format_user_friendly_error
+
+    text = format_user_friendly_error(ValueError("bad data"), context="loading")
+
+    assert text.split("\n") == [
+        "ERROR TYPE: Data Error",
+        "CONTEXT: loading",
+        "DETAILS: bad data",
+        "SUGGESTION: Check your data format and ensure it's valid according to "
+        "the expected schema.",
+    ]
+
+
+def test_format_detailed_error_lists_chain_and_msix_tips():
+    from pcileechfwgenerator.error_utils import format_detailed_error
+
+    top = RuntimeError("msix setup failed")
+    top.__cause__ = ValueError("table not aligned")
+    lines = format_detailed_error(top).split("\n")
+
+    assert lines[:5] == [
+        "ERROR CATEGORY: MSI-X Error",
+        "EXCEPTION CHAIN:",
+        "  1. msix setup failed",
+        "  2. table not aligned",
+        "SUGGESTIONS:",
+    ]
+    assert all(line.startswith("  - ") for line in lines[5:])
+
+
+def test_msix_bullets_render_tip_list_directly():
+    from pcileechfwgenerator.error_utils import _msix_tips, format_user_friendly_error
+
+    exc = ValueError("Invalid MSI-X table BIR 7")
+    lines = format_user_friendly_error(exc).split("\n")
+    start = lines.index("SUGGESTIONS:") + 1
+
+    assert lines[start:] == [f"  - {tip}" for tip in _msix_tips(str(exc))]
+    assert categorize_error(exc)[1] == " ".join(f"- {t}" for t in _msix_tips(str(exc)))
+
+
+def test_format_detailed_error_to_streams_same_text():
+    import io
+
+    from pcileechfwgenerator.error_utils import (
+        format_detailed_error,
+        format_detailed_error_to,
+    )
+
+    try:
+        raise ValueError("bad data")
+    except ValueError as exc:
+        stream = io.StringIO()
+        format_detailed_error_to(stream, exc, context="x", include_traceback=True)
+        expected = format_detailed_error(exc, context="x", include_traceback=True)
+
+    assert stream.getvalue() == expected
+    assert "\nTRACEBACK:\nTraceback (most recent call last):" in expected
+
+
+def test_is_user_fixable_error():
+    from pcileechfwgenerator.error_utils import build_issue_report, is_user_fixable_error
+
+    assert is_user_fixable_error(FileNotFoundError("x.bin"))
+    assert is_user_fixable_error(ValueError("bad config value"))
+    assert not is_user_fixable_error(ValueError("bad data"))
+    assert build_issue_report(ValueError("bad data"))["user_actionable"] is False
+
+
+def test_format_detailed_error_fast_path_matches_stream():
+    import io
+
+    from pcileechfwgenerator.error_utils import (
+        format_detailed_error,
+        format_detailed_error_to,
+    )
+
+    for exc in (ValueError("bad data"), RuntimeError("Invalid MSI-X table BIR 7")):
+        for context in (None, "ctx"):
+            stream = io.StringIO()
+            format_detailed_error_to(stream, exc, context=context)
+            assert format_detailed_error(exc, context=context) == stream.getvalue()
+
+
+def test_log_error_with_root_cause_skips_work_when_disabled(monkeypatch):
+    import logging
+
+    from pcileechfwgenerator import error_utils
+
+    logger = logging.getLogger("test_error_utils.disabled")
+    logger.setLevel(logging.CRITICAL)
+
+    def _fail(_exc):
+        raise AssertionError("root cause extracted for a disabled logger")
+
+    monkeypatch.setattr(error_utils, "extract_root_cause", _fail)
+    error_utils.log_error_with_root_cause(logger, "failed", ValueError("x"))
+
+
+def test_log_error_with_root_cause_logs_root(caplog):
+    import logging
+
+    from pcileechfwgenerator.error_utils import log_error_with_root_cause
+
+    top = RuntimeError("outer")
+    top.__cause__ = ValueError("inner")
+    with caplog.at_level(logging.ERROR, logger="test_error_utils.enabled"):
+        log_error_with_root_cause(
+            logging.getLogger("test_error_utils.enabled"), "Build failed", top
+        )
+
+    assert [r.getMessage() for r in caplog.records] == ["Build failed: inner"]
@@ -69,7 +69,7 @@ def test_collect_device_context_success(monkeypatch, tmp_path: Path, logger, cap
     monkeypatch.setattr(
         HostDeviceCollector,
         "_collect_msix_data_vfio",
-        lambda self, mgr, cfg: MSIXData(preloaded=False),
+        lambda self, mgr, cfg, cfg_hex=None: MSIXData(preloaded=False),
     )
 
     collector = HostDeviceCollector("0000:03:00.0", logger=logger)
@@ -118,9 +118,9 @@ def test_collect_device_context_failure_raises_build_error(
 
 
 def test_collect_msix_found(monkeypatch, logger):
-    # Patch parse_msix_capability to report a valid capability
+    # Patch parse_msix_capability_bytes to report a valid capability
 
-    def _fake_parse(cfg_hex: str):
+    def _fake_parse(cfg_bytes: bytes):
         return {
             "table_size": 8,
             "table_bir": 0,
@@ -132,7 +132,7 @@ def test_collect_msix_found(monkeypatch, logger):
         }
 
     monkeypatch.setattr(
-        "pcileechfwgenerator.cli.host_device_collector.parse_msix_capability", _fake_parse
+        "pcileechfwgenerator.cli.host_device_collector.parse_msix_capability_bytes", _fake_parse
     )
 
     collector = HostDeviceCollector("0000:03:00.0", logger=logger)
@@ -146,11 +146,33 @@ def test_collect_msix_found(monkeypatch, logger):
     assert data.config_space_hex == b"\x01\x02\x03\x04".hex()
 
 
+def test_collect_msix_parses_bytes_and_reuses_hex(monkeypatch, logger):
+    seen = []
+
+    def _fake_parse(cfg_bytes: bytes):
+        seen.append(cfg_bytes)
+        return {"table_size": 1}
+
+    monkeypatch.setattr(
+        "pcileechfwgenerator.cli.host_device_collector.parse_msix_capability_bytes",
+        _fake_parse,
+    )
+
+    cfg = b"\x01\x02\x03\x04"
+    cfg_hex = cfg.hex()
+    collector = HostDeviceCollector("0000:03:00.0", logger=logger)
+    data = collector._collect_msix_data_vfio(None, cfg, cfg_hex)
+
+    assert seen == [cfg]
+    assert seen[0] is cfg
+    assert data.config_space_hex is cfg_hex
+
+
 def test_collect_msix_not_found(monkeypatch, logger):
     # Return None -> treated as absent capability
     monkeypatch.setattr(
-        "pcileechfwgenerator.cli.host_device_collector.parse_msix_capability",
-        lambda cfg_hex: None,
+        "pcileechfwgenerator.cli.host_device_collector.parse_msix_capability_bytes",
+        lambda cfg_bytes: None,
     )
     collector = HostDeviceCollector("0000:03:00.0", logger=logger)
     data = collector._collect_msix_data_vfio(
@@ -163,10 +185,10 @@ def test_collect_msix_not_found(monkeypatch, logger):
 
 def test_collect_msix_exception_logs_and_recovers(monkeypatch, logger, caplog):
 
-    def _boom(_cfg_hex: str):
+    def _boom(_cfg_bytes: bytes):
         raise ValueError("parse error")
 
-    monkeypatch.setattr("pcileechfwgenerator.cli.host_device_collector.parse_msix_capability", _boom)
+    monkeypatch.setattr("pcileechfwgenerator.cli.host_device_collector.parse_msix_capability_bytes", _boom)
     collector = HostDeviceCollector("0000:03:00.0", logger=logger)
     with caplog.at_level(logging.WARNING):
         data = collector._collect_msix_data_vfio(
@@ -214,3 +236,43 @@ def test_save_collected_data_writes_both_files(tmp_path: Path, logger):
     msix_payload = json.loads(msix_path.read_text())
     assert msix_payload["bdf"] == "0000:03:00.0"
     assert msix_payload["msix_info"]["table_size"] == 4
+
+
+def test_save_collected_data_context_round_trips(tmp_path: Path, logger):
+    collector = HostDeviceCollector("0000:03:00.0", logger=logger)
+    data = {
+        "bdf": "0000:03:00.0",
+        "config_space_hex": bytes(range(256)).hex() * 16,
+        "device_info": {"vendor_id": 0x10DE, "bars": [{"index": 0}]},
+        "msix_data": None,
+        "bar_models": {0: {"size": 4096}},
+    }
+
+    collector._save_collected_data(tmp_path, data)
+
+    payload = json.loads((tmp_path / "device_context.json").read_text())
+    assert payload["config_space_hex"] == data["config_space_hex"]
+    assert payload["device_info"] == data["device_info"]
+    # JSON object keys are always strings
+    assert payload["bar_models"] == {"0": {"size": 4096}}
+    assert not (tmp_path / "msix_data.json").exists()
+
+
+def test_serialize_msix_data_is_json_safe(logger):
+    collector = HostDeviceCollector("0000:03:00.0", logger=logger)
+    msix = MSIXData(
+        preloaded=True,
+        msix_info={"table_size": 4},
+        config_space_hex="0102",
+        config_space_bytes=b"\x01\x02",
+    )
+
+    serialized = collector._serialize_msix_data(msix)
+
+    assert "config_space_bytes" not in serialized
+    assert json.loads(json.dumps(serialized)) == {
+        "preloaded": True,
+        "msix_info": {"table_size": 4},
+        "config_space_hex": "0102",
+    }
+    assert collector._serialize_msix_data(MSIXData(preloaded=False)) is None
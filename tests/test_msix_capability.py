@@ -11,7 +11,7 @@ from pcileechfwgenerator.device_clone.msix_capability import (
     BAR_IO_DEFAULT_SIZE, BAR_MEM_DEFAULT_SIZE, BAR_MEM_MIN_SIZE, find_cap,
     generate_msix_capability_registers, generate_msix_table_sv, hex_to_bytes,
     is_valid_offset, msix_size, parse_bar_info_from_config_space,
-    parse_msix_capability, read_u8, read_u16_le, read_u32_le,
+    parse_msix_capability, parse_msix_capability_bytes, read_u8, read_u16_le, read_u32_le,
     validate_msix_configuration, validate_msix_configuration_enhanced)
 
 
@@ -404,6 +404,20 @@ class TestMsixParsing:
         assert result["table_size"] == 0
         assert result["enabled"] is False
 
+    def test_parse_msix_capability_bytes_matches_hex(self):
+        """Test bytes parser agrees with the hex-string parser."""
+        for config_space in (
+            self.create_msix_config_space(
+                table_size=32, table_bir=1, table_offset=0x2000, pba_bir=2
+            ),
+            self.create_msix_config_space(enabled=False, function_mask=True),
+            "00" * 256,
+        ):
+            cfg_bytes = bytes.fromhex(config_space)
+            assert parse_msix_capability_bytes(cfg_bytes) == parse_msix_capability(
+                config_space
+            )
+
 
 class TestBarParsing:
     """Test BAR information parsing."""
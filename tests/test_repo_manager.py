@@ -2,12 +2,20 @@
 """Unit tests for the RepoManager helper (single-path policy)."""
 
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
 from pcileechfwgenerator.file_management import repo_manager
 
 
+@pytest.fixture(autouse=True)
+def _reset_validation_cache():
+    repo_manager.RepoManager.invalidate_cache()
+    yield
+    repo_manager.RepoManager.invalidate_cache()
+
+
 def _seed_minimal_submodule(root: Path) -> None:
     """Create minimal valid submodule structure with .git and board dirs."""
     (root / ".git").mkdir(parents=True, exist_ok=True)
@@ -110,3 +118,239 @@ def test_is_repository_accessible_success(
         repo_manager.is_repository_accessible("CaptainDMA", repo_root=assets)
         is True
     )
+
+
+def test_git_available_probes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The strict git probe subprocess runs only once per process."""
+    calls = []
+    monkeypatch.setattr(
+        repo_manager, "_run", lambda cmd, **kwargs: calls.append(cmd)
+    )
+    repo_manager._git_available.cache_clear()
+    try:
+        assert repo_manager._git_available(strict=True) is True
+        assert repo_manager._git_available(strict=True) is True
+    finally:
+        repo_manager._git_available.cache_clear()
+
+    assert calls == [["git", "--version"]]
+
+
+def test_git_available_default_searches_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The default check looks git up on PATH without running it."""
+    monkeypatch.setattr(
+        repo_manager, "_run", lambda *a, **k: pytest.fail("git was run")
+    )
+    repo_manager._git_available.cache_clear()
+    try:
+        monkeypatch.setattr(repo_manager._shutil, "which", lambda name: None)
+        assert repo_manager._git_available() is False
+        repo_manager._git_available.cache_clear()
+        monkeypatch.setattr(
+            repo_manager._shutil, "which", lambda name: "/usr/bin/" + name
+        )
+        assert repo_manager._git_available() is True
+    finally:
+        repo_manager._git_available.cache_clear()
+
+
+def test_ensure_repo_validates_once_until_invalidated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A validated submodule is not re-checked until the cache is cleared."""
+    assets = tmp_path / "voltcyclone-fpga"
+    _seed_minimal_submodule(assets)
+    monkeypatch.setattr(repo_manager, "SUBMODULE_PATH", assets)
+    checks = []
+    monkeypatch.setattr(
+        repo_manager.RepoManager,
+        "_check_repo",
+        classmethod(lambda cls, p: checks.append(p) or True),
+    )
+
+    assert repo_manager.RepoManager.ensure_repo() == assets
+    assert repo_manager.RepoManager.ensure_repo() == assets
+    assert repo_manager.RepoManager._is_valid_repo(assets) is True
+    assert checks == [assets]
+
+    repo_manager.RepoManager.invalidate_cache()
+    repo_manager.RepoManager.ensure_repo()
+    assert checks == [assets, assets]
+
+
+def test_is_valid_repo_does_not_cache_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An invalid checkout is re-checked on every call."""
+    results = iter([False, True])
+    monkeypatch.setattr(
+        repo_manager.RepoManager,
+        "_check_repo",
+        classmethod(lambda cls, p: next(results)),
+    )
+
+    assert repo_manager.RepoManager._is_valid_repo(tmp_path) is False
+    assert repo_manager.RepoManager._is_valid_repo(tmp_path) is True
+
+
+def _git_checkout(root: Path, *, commit: bool = True) -> Optional[str]:
+    """Create a git repository at *root*; return its HEAD or skip the test."""
+    import os
+    import subprocess
+
+    root.mkdir()
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "t",
+        "GIT_AUTHOR_EMAIL": "t@example.com",
+        "GIT_COMMITTER_NAME": "t",
+        "GIT_COMMITTER_EMAIL": "t@example.com",
+    }
+    try:
+        subprocess.run(["git", "init", "-q"], cwd=root, check=True, env=env)
+        if not commit:
+            return None
+        subprocess.run(
+            ["git", "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=root,
+            check=True,
+            env=env,
+        )
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("git not available")
+
+
+def test_head_commit_reads_checkout(tmp_path: Path) -> None:
+    """head_commit reports the checked-out commit of a real git checkout."""
+    repo = tmp_path / "repo"
+    expected = _git_checkout(repo)
+
+    assert repo_manager.RepoManager.head_commit(repo) == expected
+    # A plain directory nested in a checkout has no commit of its own
+    (repo / "sub").mkdir()
+    assert repo_manager.RepoManager.head_commit(repo / "sub") is None
+
+
+def test_is_valid_repo_records_head_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Validation's rev-parse also provides HEAD, and unborn HEADs are valid."""
+    monkeypatch.setattr(repo_manager, "_is_container_env", lambda: False)
+    repo = tmp_path / "repo"
+    expected = _git_checkout(repo)
+    empty = tmp_path / "empty"
+    _git_checkout(empty, commit=False)
+
+    assert repo_manager.RepoManager._is_valid_repo(repo) is True
+    assert repo_manager.RepoManager._is_valid_repo(empty) is True
+
+    def _no_git(*_args, **_kwargs):
+        raise AssertionError("git run again")
+
+    monkeypatch.setattr(repo_manager, "_run", _no_git)
+    assert repo_manager.RepoManager.head_commit(repo) == expected
+
+
+def test_get_xdc_files_single_walk_order(tmp_path: Path) -> None:
+    """XDC files come from one sorted walk plus symlinked constraint dirs."""
+    board = tmp_path / "CaptainDMA" / "75t484_x1"
+    (board / "src").mkdir(parents=True)
+    (board / "constraints" / "extra").mkdir(parents=True)
+    (board / "top.xdc").write_text("")
+    (board / "src" / "pins.xdc").write_text("")
+    (board / "constraints" / "extra" / "timing.xdc").write_text("")
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "common.xdc").write_text("")
+    (board / "xdc").symlink_to(shared, target_is_directory=True)
+
+    files = repo_manager.RepoManager.get_xdc_files(
+        "pcileech_75t484_x1", repo_root=tmp_path
+    )
+
+    assert files == [
+        board / "constraints" / "extra" / "timing.xdc",
+        board / "src" / "pins.xdc",
+        board / "top.xdc",
+        board / "xdc" / "common.xdc",
+    ]
+
+
+def test_xdc_lookups_cached_until_invalidated(tmp_path: Path) -> None:
+    """XDC file lists and combined text are reused until invalidate_cache()."""
+    board = tmp_path / "CaptainDMA" / "75t484_x1"
+    board.mkdir(parents=True)
+    (board / "pins.xdc").write_text("set_property PACKAGE_PIN A1 [get_ports clk]\n")
+    rm = repo_manager.RepoManager
+
+    text = rm.read_combined_xdc("pcileech_75t484_x1", repo_root=tmp_path)
+    assert "# ==== CaptainDMA/75t484_x1/pins.xdc ====" in text
+    files = rm.get_xdc_files("pcileech_75t484_x1", repo_root=tmp_path)
+    files.append(board / "bogus.xdc")  # callers get their own list
+
+    (board / "extra.xdc").write_text("# extra\n")
+    assert rm.get_xdc_files("pcileech_75t484_x1", repo_root=tmp_path) == [
+        board / "pins.xdc"
+    ]
+    assert rm.read_combined_xdc("pcileech_75t484_x1", repo_root=tmp_path) == text
+
+    rm.invalidate_cache()
+    assert "# extra" in rm.read_combined_xdc("pcileech_75t484_x1", repo_root=tmp_path)
+
+
+def test_read_combined_xdc_keeps_file_order(tmp_path: Path) -> None:
+    """Concurrently read constraint files are joined in file order."""
+    board = tmp_path / "CaptainDMA" / "75t484_x1"
+    (board / "src").mkdir(parents=True)
+    names = [f"part{i:02d}.xdc" for i in range(12)]
+    for name in names:
+        (board / "src" / name).write_text(f"# {name}\n")
+
+    text = repo_manager.RepoManager.read_combined_xdc(
+        "pcileech_75t484_x1", repo_root=tmp_path
+    )
+
+    positions = [text.index(f"# {name}\n") for name in names]
+    assert positions == sorted(positions)
+    assert text.count("# ==== CaptainDMA/75t484_x1/src/") == len(names)
+
+
+def test_is_valid_repo_reads_git_files_without_subprocess(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Submodule checkouts validate from their gitdir pointer and HEAD file."""
+    monkeypatch.setattr(repo_manager, "_is_container_env", lambda: False)
+    runs = []
+
+    def _failing_run(cmd, **kwargs):
+        runs.append(cmd)
+        raise OSError("git not runnable")
+
+    monkeypatch.setattr(repo_manager, "_run", _failing_run)
+    monkeypatch.setattr(repo_manager, "_git_available", lambda strict=False: True)
+
+    sha = "0123456789abcdef0123456789abcdef01234567"
+    modules = tmp_path / "super" / ".git" / "modules" / "fpga"
+    modules.mkdir(parents=True)
+    (modules / "HEAD").write_text(sha + "\n")
+    checkout = tmp_path / "super" / "lib" / "fpga"
+    checkout.mkdir(parents=True)
+    (checkout / ".git").write_text("gitdir: ../../.git/modules/fpga\n")
+
+    assert repo_manager.RepoManager._is_valid_repo(checkout) is True
+    assert repo_manager.RepoManager.head_commit(checkout) == sha
+    assert runs == []
+
+    # A pointer to missing metadata still needs git, which fails here
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    (broken / ".git").write_text("gitdir: ../nowhere\n")
+    assert repo_manager.RepoManager._is_valid_repo(broken) is False
+    assert runs
@@ -457,6 +457,18 @@ class TestLoggingFunctions:
         assert "Debug: details" in call_args
         assert "DEBUG" in call_args
 
+    def test_log_debug_safe_skips_format_when_disabled(self):
+        """Test disabled levels skip formatting and emit nothing."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+
+        with patch("pcileechfwgenerator.string_utils.safe_format") as mock_format:
+            log_debug_safe(mock_logger, "Debug: {info}", info="details")
+
+        mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        mock_format.assert_not_called()
+        mock_logger.debug.assert_not_called()
+
 
 class TestMultilineFormat:
     """Test cases for multiline format function."""
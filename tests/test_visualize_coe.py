@@ -19,6 +19,7 @@ from scripts.visualize_coe import (
     decode_pcie_capability,
     format_class_rev,
     format_split_dword,
+    main,
     parse_coe_file,
     walk_capabilities,
 )
@@ -427,6 +428,24 @@ memory_initialization_vector=
         assert capabilities[0][1] == 0x01  # Power Management
         assert capabilities[1][1] == 0x11  # MSI-X
 
+    def test_main_accepts_argv(self, tmp_path, capsys):
+        """Test main() can be driven in-process with an explicit argv."""
+        coe_file = tmp_path / "single.coe"
+        coe_file.write_text("""
+memory_initialization_radix=16;
+memory_initialization_vector=
+8086100E,
+00100007,
+02000003;
+""")
+
+        assert main([str(coe_file)]) == 0
+        assert "single.coe" in capsys.readouterr().out
+
+    def test_main_missing_file_returns_error(self, tmp_path):
+        """Test main() reports a missing file via its return code."""
+        assert main([str(tmp_path / "missing.coe")]) == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])